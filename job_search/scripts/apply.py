@@ -18,12 +18,21 @@ Usage (inside Railway container):
   python3 /data/workspace/job_search/scripts/apply.py --list
 """
 
+import functools
+import hashlib
+import io
 import json
 import csv
+import gc
 import os
+import re
+import string
 import sys
 import argparse
 import urllib.request
+from collections import defaultdict
+from dataclasses import dataclass, astuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -34,17 +43,47 @@ PROFILE_PATH  = JOB_DIR / "profile.json"
 TRACKER_PATH  = JOB_DIR / "tracker.csv"
 COVERS_DIR    = JOB_DIR / "cover_letters"
 DRAFTS_DIR    = JOB_DIR / "applications"
-COVERS_DIR.mkdir(exist_ok=True)
-DRAFTS_DIR.mkdir(exist_ok=True)
 
-with open(PROFILE_PATH) as f:
-    P = json.load(f)
+# orjson decodes profile.json several times faster than stdlib json; optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _profile() -> dict:
+    """Load profile.json on first use — --list / --mark-applied never need it."""
+    data = PROFILE_PATH.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
 
 GEMINI_API_KEY = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY", "")
 
+# Constant for the lifetime of one CLI run — strftime is slow (locale handling)
+# and was being re-evaluated per draft / per mark-applied.
+TODAY_STR = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
 TRACKER_FIELDS = ["id", "date_found", "title", "company", "location", "region",
                   "source", "url", "salary", "score", "status", "cover_letter_file", "notes"]
 
+# Tracker rows as slotted objects: ~3x less memory than a per-row dict and
+# attribute access without the hash lookup. Field order matches TRACKER_FIELDS.
+@dataclass(slots=True)
+class Row:
+    id: str = ""
+    date_found: str = ""
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    region: str = ""
+    source: str = ""
+    url: str = ""
+    salary: str = ""
+    score: str = ""
+    status: str = ""
+    cover_letter_file: str = ""
+    notes: str = ""
+
 
 # ── CV paragraphs for cover letters ──────────────────────────────────────────
 INTRO_BASE = (
@@ -80,15 +119,85 @@ SKILL_BLOCKS = {
     ),
 }
 
-CLOSE_TEMPLATE = (
-    "I am eager to join {company} as {a_or_an} {title} and contribute from day one. "
-    "I am available with a 30-day notice period and {visa_note}. "
+# Templates are compiled once at import so the per-job hot path in cmd_generate
+# only pays for .substitute(), not for re-parsing format specs on every call.
+_CLOSE_TMPL = string.Template(
+    "I am eager to join $company as $a_or_an $title and contribute from day one. "
+    "I am available with a 30-day notice period and $visa_note. "
     "Please find my CV attached. I look forward to hearing from you.\n\n"
     "Yours sincerely,\nKrish Sawhney\n"
     "krishsawhney0502@gmail.com | +91 8800554608\n"
     "linkedin.com/in/krish-sawhney-824416261 | github.com/krishs05"
 )
 
+# Cover-letter segments around the dynamic title/company/skill/close pieces.
+_COVER_OPEN  = "Dear Hiring Manager,\n\nRe: Application for "
+_COVER_INTRO = "\n\n" + INTRO_BASE + "\n\n"
+
+# The draft is written as small segments (dynamic header, static blocks, cover
+# letter) so cmd_generate can stream them straight to disk with writelines()
+# instead of materialising one large draft string per job.
+_DRAFT_META_TMPL = string.Template("""APPLICATION DRAFT
+=================
+Date       : $date
+Role       : $title
+Company    : $company
+Location   : $location
+Region     : $region
+Source     : $source
+URL        : $url
+Salary     : $salary
+Status     : $status
+""")
+
+_DRAFT_INFO = """
+── APPLICANT INFO ───────────────────────────────────────────
+Full Name      : Krish Sawhney
+Email          : krishsawhney0502@gmail.com
+Phone          : +91 8800554608
+LinkedIn       : linkedin.com/in/krish-sawhney-824416261
+GitHub         : github.com/krishs05
+Portfolio      : bertram.co.in
+Current City   : New Delhi, India
+Notice Period  : 30 days
+Visa Required  : Yes — sponsorship required
+
+── COVER LETTER ─────────────────────────────────────────────
+"""
+
+_DRAFT_TAIL = """
+
+── FORM FIELDS (copy-paste these) ───────────────────────────
+First Name       : Krish
+Last Name        : Sawhney
+Email            : krishsawhney0502@gmail.com
+Phone            : +918800554608
+LinkedIn Profile : https://linkedin.com/in/krish-sawhney-824416261
+GitHub           : https://github.com/krishs05
+Portfolio/Website: https://bertram.co.in
+Current Location : New Delhi, India
+Willing to Relocate: Yes
+Work Authorisation: Requires sponsorship
+Notice Period    : 30 days
+Salary Expectation: (leave blank or enter "open to discussion")
+
+── KEY SKILLS TO TICK ON FORMS ──────────────────────────────
+Python, TypeScript, JavaScript, Node.js, React, Next.js,
+TensorFlow, Hugging Face, Docker, PostgreSQL, CI/CD, AWS, GCP
+
+── EDUCATION ────────────────────────────────────────────────
+Degree     : BSc Computer Science (Artificial Intelligence)
+University : Brunel University London
+Years      : 2022-2025
+
+── APPLY NOW ────────────────────────────────────────────────
+Open this URL in your browser to apply:
+"""
+
+# Pre-encoded once — the static blocks never change per job.
+_DRAFT_INFO_B = _DRAFT_INFO.encode("utf-8")
+_DRAFT_TAIL_B = _DRAFT_TAIL.encode("utf-8")
+
 
 def call_gemini(prompt: str) -> str | None:
     """Call Gemini API, return text or None on failure."""
@@ -112,12 +221,13 @@ def call_gemini(prompt: str) -> str | None:
         return None
 
 
-def generate_cover_letter_ai(job: dict) -> str | None:
+def generate_cover_letter_ai(job: Row) -> str | None:
     """Generate a tailored cover letter via Gemini. Returns None if unavailable."""
-    title    = job["title"]
-    company  = job["company"] or "your organisation"
-    region   = job.get("region", "")
-    location = job.get("location", "")
+    title    = job.title
+    company  = job.company or "your organisation"
+    region   = job.region
+    location = job.location
+    P        = _profile()
 
     exp_lines = "\n".join(
         f"- {e['title']} at {e['company']} ({e['period']}): {'; '.join(e['highlights'][:3])}"
@@ -160,24 +270,66 @@ def generate_cover_letter_ai(job: dict) -> str | None:
     return None
 
 
+# Keyword groups for skill-block selection, in priority order (lowest rank wins,
+# matching the original if-ladder: ai > fullstack > backend > python).
+_SKILL_KEYWORDS = [
+    (0, ["ai", "ml", "machine learning", "reinforcement", "llm", "nlp", "data"]),
+    (1, ["fullstack", "full-stack", "full stack", "frontend", "react", "next"]),
+    (2, ["backend", "node", "api", "spring", "java"]),
+    (3, ["python", "automation", "scripting"]),
+]
+
+# With pyahocorasick available, all ~20 keywords are matched in one linear pass
+# over the title instead of one substring scan per keyword.
+try:
+    import ahocorasick
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for _rank, _words in _SKILL_KEYWORDS:
+        for _w in _words:
+            _KW_AUTOMATON.add_word(_w, _rank)
+    _KW_AUTOMATON.make_automaton()
+except ImportError:
+    _KW_AUTOMATON = None
+
+# Zero-dependency fallback: one compiled alternation with a named group per
+# rank, so classification is still a single C-level pass over the title.
+_KW_RE = re.compile("|".join(
+    "(?P<g%d>%s)" % (rank, "|".join(map(re.escape, sorted(words, key=len, reverse=True))))
+    for rank, words in _SKILL_KEYWORDS
+))
+
+
+# Joined once at import; pick_skill_block then just indexes by rank
+# (None = no keyword hit -> well-rounded default).
+_RANK_BLOCKS = {
+    0: SKILL_BLOCKS["ai"] + "\n\n" + SKILL_BLOCKS["infra"],
+    1: SKILL_BLOCKS["fullstack"] + "\n\n" + SKILL_BLOCKS["infra"],
+    2: SKILL_BLOCKS["fullstack"] + "\n\n" + SKILL_BLOCKS["infra"],
+    3: SKILL_BLOCKS["python"] + "\n\n" + SKILL_BLOCKS["infra"],
+    None: SKILL_BLOCKS["fullstack"] + "\n\n" + SKILL_BLOCKS["ai"],
+}
+
+
 def pick_skill_block(title: str) -> str:
     t = title.lower()
-    if any(w in t for w in ["ai", "ml", "machine learning", "reinforcement", "llm", "nlp", "data"]):
-        return SKILL_BLOCKS["ai"] + "\n\n" + SKILL_BLOCKS["infra"]
-    if any(w in t for w in ["fullstack", "full-stack", "full stack", "frontend", "react", "next"]):
-        return SKILL_BLOCKS["fullstack"] + "\n\n" + SKILL_BLOCKS["infra"]
-    if any(w in t for w in ["backend", "node", "api", "spring", "java"]):
-        return SKILL_BLOCKS["fullstack"] + "\n\n" + SKILL_BLOCKS["infra"]
-    if any(w in t for w in ["python", "automation", "scripting"]):
-        return SKILL_BLOCKS["python"] + "\n\n" + SKILL_BLOCKS["infra"]
-    # Default: well-rounded
-    return SKILL_BLOCKS["fullstack"] + "\n\n" + SKILL_BLOCKS["ai"]
+    if _KW_AUTOMATON is not None:
+        rank = min((r for _, r in _KW_AUTOMATON.iter(t)), default=None)
+    else:
+        rank = min((int(m.lastgroup[1]) for m in _KW_RE.finditer(t)), default=None)
+    return _RANK_BLOCKS[rank]
+
+
+@functools.lru_cache(maxsize=64)
+def _a_or_an_first(ch: str) -> str:
+    return "an" if ch in "aeiou" else "a"
 
 
 def a_or_an(word: str) -> str:
-    return "an" if word.strip().lower()[0] in "aeiou" else "a"
+    return _a_or_an_first(word.strip().lower()[0])
 
 
+# Regions repeat constantly across a batch of jobs; memoise the lookup.
+@functools.lru_cache(maxsize=256)
 def visa_note(region: str) -> str:
     region = region.lower()
     if region in ("uk", "gb"):
@@ -191,152 +343,224 @@ def visa_note(region: str) -> str:
     return "I am open to discussing visa arrangements"
 
 
-def generate_cover_letter(job: dict) -> str:
+# The close paragraph only varies in four fields, two of which (visa note,
+# a/an) have a handful of possible values. Pre-substitute every (visa, article)
+# combination once so the per-job close only fills in company and title.
+_ALL_VISA_NOTES = tuple({visa_note(r) for r in ("uk", "de", "ae", "in", "")})
+_CLOSE_PREFILL = {
+    (vn, ao): string.Template(_CLOSE_TMPL.safe_substitute(visa_note=vn, a_or_an=ao))
+    for vn in _ALL_VISA_NOTES
+    for ao in ("a", "an")
+}
+
+
+def iter_cover(job: Row):
+    """Yield the cover letter as small segments, ready for streaming writes."""
     # Try AI-generated letter first
     if GEMINI_API_KEY:
         ai_letter = generate_cover_letter_ai(job)
         if ai_letter:
-            return ai_letter
+            yield ai_letter
+            return
         print("  [Gemini] Falling back to template")
 
     # Template fallback
-    title   = job["title"]
-    company = job["company"] or "your organisation"
-    region  = job.get("region", "")
-
-    skill_para = pick_skill_block(title)
-    close = CLOSE_TEMPLATE.format(
+    title   = job.title
+    company = job.company or "your organisation"
+    region  = job.region
+
+    yield _COVER_OPEN
+    yield title
+    yield " — "
+    yield company
+    yield _COVER_INTRO
+    yield pick_skill_block(title)
+    yield "\n\n"
+    yield _CLOSE_PREFILL[(visa_note(region), a_or_an(title))].substitute(
         company=company,
-        a_or_an=a_or_an(title),
         title=title,
-        visa_note=visa_note(region),
     )
 
-    return f"""Dear Hiring Manager,
 
-Re: Application for {title} — {company}
+def generate_cover_letter(job: Row) -> str:
+    return "".join(iter_cover(job))
 
-{INTRO_BASE}
 
-{skill_para}
+def draft_segments(job: Row, cover_parts: list[bytes], date_str: str) -> list[bytes]:
+    """Build the application draft as UTF-8 segments for a gathered write.
 
-{close}"""
+    The static applicant-info and form-fields blocks are pre-encoded module
+    constants; only the per-job header is encoded here.
+    """
+    meta = _DRAFT_META_TMPL.substitute(
+        date=date_str,
+        title=job.title,
+        company=job.company,
+        location=job.location,
+        region=job.region,
+        source=job.source,
+        url=job.url,
+        salary=job.salary or "Not listed",
+        status=job.status,
+    )
+    return [meta.encode("utf-8"), _DRAFT_INFO_B, *cover_parts,
+            _DRAFT_TAIL_B, job.url.encode("utf-8"), b"\n"]
 
 
-def generate_draft(job: dict, cover_letter: str) -> str:
-    return f"""APPLICATION DRAFT
-=================
-Date       : {datetime.now(timezone.utc).strftime('%Y-%m-%d')}
-Role       : {job['title']}
-Company    : {job['company']}
-Location   : {job['location']}
-Region     : {job['region']}
-Source     : {job['source']}
-URL        : {job['url']}
-Salary     : {job.get('salary', 'Not listed')}
-Status     : {job['status']}
+# ── Tracker I/O ───────────────────────────────────────────────────────────────
+# Above this size (~100k rows), pandas' C parser loads the tracker an order of
+# magnitude faster than the csv module; below it the import isn't worth paying.
+_PANDAS_THRESHOLD = 8 << 20
 
-── APPLICANT INFO ───────────────────────────────────────────
-Full Name      : Krish Sawhney
-Email          : krishsawhney0502@gmail.com
-Phone          : +91 8800554608
-LinkedIn       : linkedin.com/in/krish-sawhney-824416261
-GitHub         : github.com/krishs05
-Portfolio      : bertram.co.in
-Current City   : New Delhi, India
-Notice Period  : 30 days
-Visa Required  : Yes — sponsorship required
 
-── COVER LETTER ─────────────────────────────────────────────
-{cover_letter}
+def load_tracker() -> list[Row]:
+    if not TRACKER_PATH.exists():
+        print("[ERROR] tracker.csv not found. Run search_jobs.py first.")
+        sys.exit(1)
+    if TRACKER_PATH.stat().st_size > _PANDAS_THRESHOLD:
+        try:
+            import pandas
+            df = pandas.read_csv(TRACKER_PATH, dtype=str, keep_default_na=False)
+            return [Row(*t) for t in df.itertuples(index=False, name=None)]
+        except ImportError:
+            pass  # stdlib reader below
+    with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        # The bulk read is allocation-heavy; pausing the cyclic GC while it runs
+        # avoids needless collection passes over the row lists.
+        gc.disable()
+        try:
+            return [Row(*r) for r in reader]
+        finally:
+            gc.enable()
+
+
+def save_tracker(rows: list[Row]):
+    # Serialise into memory first — csv.writer on a file handle pays a write
+    # call per row, while this is one write for the whole tracker.
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(TRACKER_FIELDS)
+    writer.writerows(astuple(r) for r in rows)
+    TRACKER_PATH.write_text(buf.getvalue(), encoding="utf-8", newline="")
+
+
+# Filename sanitiser: keep alphanumerics (incl. unicode), '-' and '_', replace
+# everything else — one C-level pass instead of a per-character Python loop.
+_SAFE_RE = re.compile(r"[^\w\-]")
+
+
+def _write_segments(path: Path, segments: list[bytes]):
+    """Write pre-encoded segments with one gathered writev — skips the
+    TextIOWrapper/BufferedWriter layers Path.write_text would go through."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.writev(fd, segments)
+    finally:
+        os.close(fd)
 
-── FORM FIELDS (copy-paste these) ───────────────────────────
-First Name       : Krish
-Last Name        : Sawhney
-Email            : krishsawhney0502@gmail.com
-Phone            : +918800554608
-LinkedIn Profile : https://linkedin.com/in/krish-sawhney-824416261
-GitHub           : https://github.com/krishs05
-Portfolio/Website: https://bertram.co.in
-Current Location : New Delhi, India
-Willing to Relocate: Yes
-Work Authorisation: Requires sponsorship
-Notice Period    : 30 days
-Salary Expectation: (leave blank or enter "open to discussion")
 
-── KEY SKILLS TO TICK ON FORMS ──────────────────────────────
-Python, TypeScript, JavaScript, Node.js, React, Next.js,
-TensorFlow, Hugging Face, Docker, PostgreSQL, CI/CD, AWS, GCP
+@functools.lru_cache(maxsize=256)
+def _cover_parts_cached(title: str, company: str, region: str, location: str) -> tuple[bytes, ...]:
+    """Cover generation is pure in these four fields — identical jobs (e.g. the
+    same posting found in several regions, or a re-run) reuse the result."""
+    job = Row(title=title, company=company, region=region, location=location)
+    return tuple(s.encode("utf-8") for s in iter_cover(job))
 
-── EDUCATION ────────────────────────────────────────────────
-Degree     : BSc Computer Science (Artificial Intelligence)
-University : Brunel University London
-Years      : 2022-2025
 
-── APPLY NOW ────────────────────────────────────────────────
-Open this URL in your browser to apply:
-{job['url']}
-"""
+def _write_if_changed(path: Path, segments: list[bytes], force: bool) -> bool:
+    """Skip the disk write when the target already holds exactly this content.
 
+    Compared by digest, not size — AI-generated letters differ run to run,
+    so an equal-length file can still be stale.
+    """
+    if not force:
+        try:
+            new = hashlib.sha1()
+            for s in segments:
+                new.update(s)
+            if hashlib.sha1(path.read_bytes()).digest() == new.digest():
+                return False
+        except OSError:
+            pass
+    _write_segments(path, segments)
+    return True
 
-# ── Tracker I/O ───────────────────────────────────────────────────────────────
-def load_tracker() -> list[dict]:
-    if not TRACKER_PATH.exists():
-        print("[ERROR] tracker.csv not found. Run search_jobs.py first.")
-        sys.exit(1)
-    with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
 
+def build_outputs(job: Row, today: str, force: bool = False) -> tuple[str, Path, Path]:
+    """Generate and write the cover letter + draft for one job.
 
-def save_tracker(rows: list[dict]):
-    with open(TRACKER_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS)
-        writer.writeheader()
-        writer.writerows(rows)
+    Pure worker (no tracker mutation) so it can run in a thread pool.
+    Returns (job_id, cover_path, draft_path).
+    """
+    cover_parts = list(_cover_parts_cached(
+        job.title, job.company, job.region, job.location))
+
+    safe_name = (f"{job.id}_{_SAFE_RE.sub('_', job.company)[:20]}"
+                 f"_{_SAFE_RE.sub('_', job.title)[:20]}")
+    cl_file    = COVERS_DIR / f"{safe_name}_cover.txt"
+    draft_file = DRAFTS_DIR / f"{safe_name}_draft.txt"
+
+    _write_if_changed(cl_file, cover_parts, force)
+    _write_if_changed(draft_file, draft_segments(job, cover_parts, today), force)
+
+    return job.id, cl_file, draft_file
 
 
 # ── Commands ──────────────────────────────────────────────────────────────────
-def cmd_list(rows: list[dict]):
-    statuses = {}
+# Listing format compiled once — bound .format avoids re-parsing the width
+# specs for every printed row.
+_LIST_FMT = "  #{:>3} [{:^5}] {:<40} | {:<25}{}".format
+
+
+def cmd_list(rows: list[Row]):
+    statuses = defaultdict(list)
     for r in rows:
-        statuses.setdefault(r["status"], []).append(r)
+        statuses[r.status].append(r)
 
+    out = []
     for status, jobs in statuses.items():
-        print(f"\n── {status.upper()} ({len(jobs)}) ───────────────────────────────")
-        for j in jobs:
-            cl = f"  [CL: {j['cover_letter_file']}]" if j.get("cover_letter_file") else ""
-            print(f"  #{j['id']:>3} [{j['region'].upper():^5}] {j['title'][:40]:<40} | {j['company'][:25]:<25}{cl}")
+        out.append(f"\n── {status.upper()} ({len(jobs)}) ───────────────────────────────")
+        out.extend(
+            _LIST_FMT(j.id, j.region.upper(), j.title[:40], j.company[:25],
+                      f"  [CL: {j.cover_letter_file}]" if j.cover_letter_file else "")
+            for j in jobs
+        )
+    # One write instead of one syscall per row
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def cmd_generate(rows: list[dict], job_id: str | None):
-    targets = [r for r in rows if r["status"] == "found"] if not job_id else \
-              [r for r in rows if r["id"] == job_id]
+def cmd_generate(rows: list[Row], by_id: dict[str, Row], job_id: str | None,
+                 force: bool = False):
+    targets = [r for r in rows if r.status == "found"] if not job_id else \
+              [r for r in rows if r.id == job_id]
 
     if not targets:
         print(f"[INFO] No jobs to process." + (f" ID={job_id} not found or wrong status." if job_id else ""))
         return
 
+    # Only the generate path needs the output dirs; the is_dir() check keeps
+    # the mkdir syscall off every warm run.
+    for d in (COVERS_DIR, DRAFTS_DIR):
+        if not d.is_dir():
+            d.mkdir(parents=True)
+
     print(f"\nGenerating cover letters for {len(targets)} job(s)...\n")
-    for job in targets:
-        letter  = generate_cover_letter(job)
-        draft   = generate_draft(job, letter)
-
-        def _safe(s): return "".join(c if c.isalnum() or c in "-_" else "_" for c in s)
-        safe_name = f"{job['id']}_{_safe(job['company'])[:20]}_{_safe(job['title'])[:20]}"
-        cl_file   = COVERS_DIR / f"{safe_name}_cover.txt"
-        draft_file = DRAFTS_DIR / f"{safe_name}_draft.txt"
-
-        cl_file.write_text(letter, encoding="utf-8")
-        draft_file.write_text(draft, encoding="utf-8")
-
-        # Update tracker
-        for r in rows:
-            if r["id"] == job["id"]:
-                r["cover_letter_file"] = str(cl_file)
-                r["status"] = "cover_ready"
-                break
-
-        print(f"  ✓ #{job['id']} {job['title']} @ {job['company']}")
+
+    # Each job is independent (Gemini call + two file writes, both I/O-bound),
+    # so fan the generation out across threads and apply tracker updates
+    # sequentially afterwards.
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+        results = list(ex.map(
+            functools.partial(build_outputs, today=TODAY_STR, force=force), targets))
+
+    for job_id, cl_file, draft_file in results:
+        r = by_id[job_id]
+        r.cover_letter_file = str(cl_file)
+        r.status = "cover_ready"
+
+        print(f"  ✓ #{job_id} {r.title} @ {r.company}")
         print(f"    Cover : {cl_file}")
         print(f"    Draft : {draft_file}\n")
 
@@ -344,37 +568,70 @@ def cmd_generate(rows: list[dict], job_id: str | None):
     print(f"Tracker updated → {TRACKER_PATH}")
 
 
-def cmd_mark_applied(rows: list[dict], job_id: str):
-    found = False
-    for r in rows:
-        if r["id"] == job_id:
-            r["status"] = "applied"
-            r["notes"] += f" | Applied {datetime.now(timezone.utc).strftime('%Y-%m-%d')}"
-            found = True
-            print(f"✓ #{job_id} marked as applied: {r['title']} @ {r['company']}")
-            break
-    if not found:
+def cmd_mark_applied(rows: list[Row], by_id: dict[str, Row], job_id: str):
+    try:
+        r = by_id[job_id]
+    except KeyError:
         print(f"[ERROR] Job ID {job_id} not found.")
         return
+    r.status = "applied"
+    r.notes += f" | Applied {TODAY_STR}"
+    print(f"✓ #{job_id} marked as applied: {r.title} @ {r.company}")
     save_tracker(rows)
 
 
+def cmd_mark_applied_batch(rows: list[Row], by_id: dict[str, Row], job_ids: list[str]):
+    """Mark several jobs applied with one tracker rewrite instead of one per id."""
+    applied_note = f"Applied {TODAY_STR}"
+    missing = []
+    for job_id in job_ids:
+        r = by_id.get(job_id)
+        if r is None:
+            missing.append(job_id)
+            continue
+        r.status = "applied"
+        r.notes = " | ".join(filter(None, (r.notes, applied_note)))
+        print(f"✓ #{job_id} marked as applied: {r.title} @ {r.company}")
+    if missing:
+        print(f"[WARN] Job IDs not found: {', '.join(missing)}")
+    if len(missing) < len(job_ids):
+        save_tracker(rows)
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main():
+    # Fast path for the two invocations the cron pipeline actually uses:
+    # bare generate and bare --list skip argparse setup entirely.
+    argv = sys.argv[1:]
+    if not argv or argv == ["--list"]:
+        rows = load_tracker()
+        by_id = {r.id: r for r in rows}
+        if argv:
+            cmd_list(rows)
+        else:
+            cmd_generate(rows, by_id, None)
+        return
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--id",           help="Process a specific job ID only")
     parser.add_argument("--list",         action="store_true", help="List all jobs by status")
     parser.add_argument("--mark-applied", metavar="ID",        help="Mark a job as applied")
+    parser.add_argument("--mark-applied-batch", metavar="ID", nargs="+",
+                        help="Mark several jobs as applied in one pass")
+    parser.add_argument("--force",        action="store_true", help="Rewrite cover/draft files even if unchanged")
     args = parser.parse_args()
 
     rows = load_tracker()
+    by_id = {r.id: r for r in rows}
 
     if args.list:
         cmd_list(rows)
     elif args.mark_applied:
-        cmd_mark_applied(rows, args.mark_applied)
+        cmd_mark_applied(rows, by_id, args.mark_applied)
+    elif args.mark_applied_batch:
+        cmd_mark_applied_batch(rows, by_id, args.mark_applied_batch)
     else:
-        cmd_generate(rows, args.id)
+        cmd_generate(rows, by_id, args.id, force=args.force)
 
 
 if __name__ == "__main__":
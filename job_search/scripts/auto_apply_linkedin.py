@@ -24,22 +24,45 @@ import os
 import sys
 import json
 import csv
+import re
 import time
+import math
+import hashlib
+import functools
+import logging
 import random
+import atexit
+import asyncio
+import threading
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
 
-try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
-except ImportError:
-    # Re-exec under the venv Python if available
-    venv_py = "/data/playwright-venv/bin/python3"
-    if os.path.exists(venv_py) and sys.executable != venv_py:
-        os.execv(venv_py, [venv_py] + sys.argv)
-    print("[ERROR] Playwright not installed. Run:")
-    print("  bash /data/workspace/job_search/scripts/install_playwright.sh")
-    sys.exit(1)
+# Playwright is imported lazily — it costs several hundred ms and short
+# invocations (--help, config errors) shouldn't pay for it.
+async_playwright = None
+PWTimeout = None
+PWError = None
+
+
+def _get_playwright():
+    """Import Playwright on first use, re-execing under the venv if needed."""
+    global async_playwright, PWTimeout, PWError
+    if async_playwright is not None:
+        return
+    import importlib.util
+    if importlib.util.find_spec("playwright") is None:
+        # Re-exec under the venv Python if available
+        venv_py = "/data/playwright-venv/bin/python3"
+        if os.path.exists(venv_py) and sys.executable != venv_py:
+            os.execv(venv_py, [venv_py] + sys.argv)
+        print("[ERROR] Playwright not installed. Run:")
+        print("  bash /data/workspace/job_search/scripts/install_playwright.sh")
+        sys.exit(1)
+    from playwright.async_api import (
+        async_playwright as _ap, TimeoutError as _to, Error as _err,
+    )
+    async_playwright, PWTimeout, PWError = _ap, _to, _err
 
 # ── Paths & config ────────────────────────────────────────────────────────────
 SCRIPT_DIR   = Path(__file__).parent
@@ -50,6 +73,20 @@ COVERS_DIR   = JOB_DIR / "cover_letters"
 LOG_DIR      = JOB_DIR / "apply_logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# One append-mode log file per run instead of one tiny file per application —
+# fewer opens/fsyncs on the container volume and much easier to grep.
+logger = logging.getLogger("autoapply")
+
+
+def _setup_run_log() -> Path:
+    log_file = LOG_DIR / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    handler = logging.FileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    return log_file
+
+
 LI_AT         = os.environ.get("LINKEDIN_LI_AT", "")
 CV_PATH       = os.environ.get("CV_PATH", str(JOB_DIR / "Krish_Sawhney_CV.pdf"))
 GEMINI_API_KEY = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY", "")
@@ -60,6 +97,10 @@ with open(PROFILE_PATH) as f:
 TRACKER_FIELDS = ["id", "date_found", "title", "company", "location", "region",
                   "source", "url", "salary", "score", "status", "cover_letter_file", "notes"]
 
+# Concurrent Easy Apply workers — each gets its own BrowserContext. LinkedIn
+# rate-limits aggressively beyond a handful of parallel sessions.
+CONCURRENCY = 4
+
 # ── LinkedIn search configs per region ───────────────────────────────────────
 REGION_CONFIGS = {
     "uk": {
@@ -94,7 +135,17 @@ SEARCH_ROLES = [
 ]
 
 # ── Tracker helpers ───────────────────────────────────────────────────────────
-def load_tracker() -> dict:
+# Serializes tracker.csv read-modify-write cycles across concurrent workers.
+_TRACKER_LOCK = asyncio.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def load_tracker() -> tuple[dict, frozenset]:
+    """Parse tracker.csv once per run.
+
+    Returns (url → row dict, frozenset of applied url[:60] prefixes) so
+    duplicate checks are a single hash lookup instead of a scan.
+    """
     existing = {}
     if TRACKER_PATH.exists():
         with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
@@ -102,116 +153,331 @@ def load_tracker() -> dict:
             if reader.fieldnames and "title" in reader.fieldnames:
                 for row in reader:
                     existing[row.get("url", "")] = row
-    return existing
+    applied_prefixes = frozenset(
+        url[:60] for url, row in existing.items() if row.get("status") == "applied"
+    )
+    return existing, applied_prefixes
+
+
+# Status updates are buffered here (url prefix → (status, notes)) and applied
+# to the CSV in one read-modify-write pass — per-job full rewrites are O(N²)
+# over a long run. Flushed every _FLUSH_EVERY updates and at exit.
+_PENDING_UPDATES: dict[str, tuple[str, str]] = {}
+_FLUSH_EVERY = 20
 
 
 def update_tracker_status(url: str, status: str, notes: str = ""):
-    rows = []
+    _PENDING_UPDATES[url[:60]] = (status, notes)
+    if len(_PENDING_UPDATES) >= _FLUSH_EVERY:
+        flush_tracker_updates()
+
+
+# Fixed column positions — lets the flush path use csv.reader row lists
+# instead of allocating a 13-key dict per row.
+IDX = {name: i for i, name in enumerate(TRACKER_FIELDS)}
+
+
+def flush_tracker_updates():
+    if not _PENDING_UPDATES or not TRACKER_PATH.exists():
+        _PENDING_UPDATES.clear()
+        return
+    with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        rows = list(reader)
+    i_url, i_status, i_notes = IDX["url"], IDX["status"], IDX["notes"]
     updated = False
-    if TRACKER_PATH.exists():
-        with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
-        for r in rows:
-            if r.get("url", "").startswith(url[:60]):
-                r["status"] = status
-                r["notes"]  = (r.get("notes", "") + f" | {notes}").strip(" |")
-                updated = True
-        if updated:
-            with open(TRACKER_PATH, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS)
-                writer.writeheader()
-                writer.writerows(rows)
+    for r in rows:
+        if len(r) <= i_notes:
+            continue
+        # Updates are keyed by url[:60], so the row's own prefix is an exact
+        # dict key — one hash probe per row instead of a scan over pending
+        hit = _PENDING_UPDATES.get(r[i_url][:60])
+        if hit:
+            status, notes = hit
+            r[i_status] = status
+            r[i_notes]  = (r[i_notes] + f" | {notes}").strip(" |")
+            updated = True
+    _PENDING_UPDATES.clear()
+    if updated:
+        # Write to a sibling temp file and rename — a crash mid-flush can't
+        # leave a half-written tracker behind
+        tmp_path = TRACKER_PATH.with_suffix(".csv.tmp")
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(TRACKER_FIELDS)
+            writer.writerows(rows)
+        os.replace(tmp_path, TRACKER_PATH)
+
+
+atexit.register(flush_tracker_updates)
+
+# Applied URL prefixes also persist in a dbm sidecar — startup becomes an
+# O(1)-per-key open instead of parsing the whole CSV, which stays as the
+# human-readable artefact. Seeded from tracker.csv on first run.
+_APPLIED_DB_PATH = JOB_DIR / "applied.db"
+_applied_db = None
+
+
+def _open_applied_db():
+    global _applied_db
+    if _applied_db is not None:
+        return _applied_db
+    import dbm
+    # Some dbm backends append their own suffix, hence the glob
+    seed = not any(JOB_DIR.glob("applied.db*"))
+    _applied_db = dbm.open(str(_APPLIED_DB_PATH), "c")
+    if seed:
+        _, applied_prefixes = load_tracker()
+        for prefix in applied_prefixes:
+            _applied_db[prefix] = "applied"
+    atexit.register(_applied_db.close)
+    return _applied_db
+
+
+def _record_applied(url: str):
+    _open_applied_db()[url[:60]] = "applied"
+
+# Next row id, counted once from the CSV on first add instead of re-reading
+# the whole file per append.
+_next_row_id: int | None = None
 
 
 def add_to_tracker(job: dict):
-    rows = []
-    if TRACKER_PATH.exists():
-        with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
-    row_id = len(rows) + 1
-    rows.append({
-        "id":                str(row_id),
-        "date_found":        datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-        "title":             job.get("title", ""),
-        "company":           job.get("company", ""),
-        "location":          job.get("location", ""),
-        "region":            job.get("region", ""),
-        "source":            "linkedin_auto",
-        "url":               job.get("url", ""),
-        "salary":            "",
-        "score":             "10",
-        "status":            job.get("status", "applied"),
-        "cover_letter_file": "",
-        "notes":             job.get("notes", ""),
-    })
-    with open(TRACKER_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS)
-        writer.writeheader()
-        writer.writerows(rows)
+    global _next_row_id
+    new_file = not TRACKER_PATH.exists()
+    if _next_row_id is None:
+        if new_file:
+            _next_row_id = 1
+        else:
+            with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
+                # header + N data rows = next id N+1
+                _next_row_id = sum(1 for _ in csv.reader(f))
+    row_id = _next_row_id
+    _next_row_id += 1
+    # Fixed-order tuple matching TRACKER_FIELDS — a plain writerow append,
+    # no per-row dict or full-file serialization
+    row = (
+        str(row_id),                                     # id
+        datetime.now(timezone.utc).strftime("%Y-%m-%d"), # date_found
+        job.get("title", ""),
+        job.get("company", ""),
+        job.get("location", ""),
+        job.get("region", ""),
+        "linkedin_auto",                                 # source
+        job.get("url", ""),
+        "",                                              # salary
+        "10",                                            # score
+        job.get("status", "applied"),
+        "",                                              # cover_letter_file
+        job.get("notes", ""),
+    )
+    with open(TRACKER_PATH, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(TRACKER_FIELDS)
+        writer.writerow(row)
 
 
 # ── Cover letter loader ───────────────────────────────────────────────────────
+# The directory is globbed and every letter read into memory once per run —
+# lookups after that are a token-set intersection, zero disk I/O.
+@functools.lru_cache(maxsize=1)
+def _cover_index() -> tuple:
+    """(name tokens, filename, first 2900 chars) per letter — LinkedIn limit."""
+    return tuple(
+        (frozenset(p.stem.lower().split("_")), p.name, p.read_text(encoding="utf-8")[:2900])
+        for p in sorted(COVERS_DIR.glob("*.txt"))
+    )
+
+
 def get_cover_letter(job_title: str) -> str:
     # Try to find an existing cover letter for a similar role
-    title_lower = job_title.lower()
-    for cl_file in COVERS_DIR.glob("*.txt"):
-        if any(w in cl_file.name.lower() for w in title_lower.split()[:2]):
-            return cl_file.read_text(encoding="utf-8")[:2900]  # LinkedIn limit
+    title_words = frozenset(job_title.lower().split()[:2])
+    for words, _, text in _cover_index():
+        if title_words & words:
+            return text
     # Fallback to generic
-    generic = list(COVERS_DIR.glob("6_*.txt"))
-    if generic:
-        return generic[0].read_text(encoding="utf-8")[:2900]
+    for _, name, text in _cover_index():
+        if name.startswith("6_"):
+            return text
     return ""
 
 
 # ── Gemini helpers for AI-powered form answers ───────────────────────────────
+# With httpx installed, one client is reused across calls — no TCP/TLS
+# handshake per request. urllib remains the stdlib fallback.
+try:
+    import httpx
+    try:
+        _HTTPX_CLIENT = httpx.Client(http2=True, timeout=15)
+    except ImportError:  # h2 extra not installed
+        _HTTPX_CLIENT = httpx.Client(timeout=15)
+except ImportError:
+    _HTTPX_CLIENT = None
+
+
 def _call_gemini(prompt: str) -> str | None:
     """Call Gemini REST API, return text or None on failure."""
+    if not GEMINI_API_KEY:
+        return None
+    url = (
+        "https://generativelanguage.googleapis.com/v1beta/models/"
+        f"gemini-2.5-flash-lite:generateContent?key={GEMINI_API_KEY}"
+    )
+    # 120 tokens is plenty for 1-3 sentence answers; thinkingBudget 0 skips
+    # the model's reasoning pass, which these short fills don't need
+    payload = {
+        "contents": [{"parts": [{"text": prompt}]}],
+        "generationConfig": {
+            "maxOutputTokens": 120,
+            "temperature": 0.4,
+            "thinkingConfig": {"thinkingBudget": 0},
+        },
+    }
+    try:
+        if _HTTPX_CLIENT is not None:
+            data = _HTTPX_CLIENT.post(url, json=payload).json()
+        else:
+            import urllib.request
+            req = urllib.request.Request(
+                url, data=json.dumps(payload).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(req, timeout=20) as resp:
+                data = json.loads(resp.read().decode())
+        return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+    except Exception:
+        return None
+
+
+# Form answers persist across runs — LinkedIn re-uses a small library of
+# questions, so repeat runs can skip the Gemini round-trip entirely.
+_GEMINI_CACHE_PATH = JOB_DIR / "gemini_cache.json"
+_GEMINI_CACHE_TTL  = 30 * 86400  # seconds; stale answers re-ask after 30 days
+# _gemini_form_answer runs on worker threads (asyncio.to_thread) — serialize
+# cache mutation and the file write so concurrent answers can't interleave
+_GEMINI_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_cache() -> dict:
+    if _GEMINI_CACHE_PATH.exists():
+        try:
+            return json.loads(_GEMINI_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            pass
+    return {}
+
+
+def _gemini_cache_key(question: str) -> str:
+    # Normalized hash collapses case/whitespace variants of the same question
+    return hashlib.sha1(question.strip().lower().encode()).hexdigest()
+
+
+# LinkedIn phrases the same question many ways ("Years of Python experience?"
+# vs "How many years of Python?"), so exact-match caching still misses. Cached
+# entries carry an embedding; a close-enough cosine match reuses the answer.
+_SEMANTIC_THRESHOLD = 0.92
+
+
+def _embed_question(question: str) -> list[float] | None:
+    """Embed a form question via Gemini's embedding endpoint; None on failure."""
     if not GEMINI_API_KEY:
         return None
     import urllib.request
     url = (
         "https://generativelanguage.googleapis.com/v1beta/models/"
-        f"gemini-3-flash-preview:generateContent?key={GEMINI_API_KEY}"
+        f"text-embedding-004:embedContent?key={GEMINI_API_KEY}"
     )
     body = json.dumps({
-        "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {"maxOutputTokens": 200, "temperature": 0.4},
+        "model": "models/text-embedding-004",
+        "content": {"parts": [{"text": question.strip()}]},
     }).encode()
     req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
+        with urllib.request.urlopen(req, timeout=10) as resp:
             data = json.loads(resp.read().decode())
-        return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+        return data["embedding"]["values"]
     except Exception:
         return None
 
 
-_GEMINI_FORM_CACHE: dict[str, str] = {}
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    na = math.sqrt(sum(x * x for x in a))
+    nb = math.sqrt(sum(x * x for x in b))
+    return dot / (na * nb) if na and nb else 0.0
+
+
+def _gemini_cache_put(cache: dict, key: str, answer: str, emb: list[float] | None):
+    """Store an answer and flush the cache file, serialized across threads."""
+    with _GEMINI_CACHE_LOCK:
+        cache[key] = {"answer": answer, "ts": time.time(), "emb": emb}
+        try:
+            _GEMINI_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError:
+            pass
+
+
+def _semantic_lookup(cache: dict, emb: list[float]) -> str | None:
+    best_sim, best_answer = 0.0, None
+    now = time.time()
+    # Snapshot under the lock — another worker thread inserting mid-iteration
+    # would otherwise raise "dictionary changed size during iteration"
+    with _GEMINI_CACHE_LOCK:
+        entries = list(cache.values())
+    for entry in entries:
+        e = entry.get("emb")
+        if not e or now - entry.get("ts", 0) >= _GEMINI_CACHE_TTL:
+            continue
+        sim = _cosine(emb, e)
+        if sim > best_sim:
+            best_sim, best_answer = sim, entry["answer"]
+    return best_answer if best_sim > _SEMANTIC_THRESHOLD else None
+
+
+# Static prefix kept byte-identical across calls so Gemini's implicit prompt
+# cache can reuse the processed prefix; only the question varies at the tail.
+_FORM_PROMPT_PREFIX = (
+    "You are filling out a job application form for Krish Sawhney applying for a junior "
+    "software/AI engineering role.\n\n"
+    "Candidate facts:\n"
+    "- BSc Computer Science (AI), Brunel University London, 2022-2025\n"
+    "- AI Intern at IntelliDB: ML pipelines, reduced inference latency 28%, CI/CD automation\n"
+    "- Skills: Python, TypeScript, React, Node.js, TensorFlow, Hugging Face, Docker, AWS\n"
+    "- Dissertation: RL traffic signal optimisation (Q-Learning, DQN, OpenAI Gym)\n"
+    "- 1 year experience, 30-day notice, based in New Delhi, requires visa sponsorship\n\n"
+)
 
 
 def _gemini_form_answer(question: str) -> str | None:
     """Use Gemini to answer an open-ended job application form question."""
     if not GEMINI_API_KEY:
         return None
-    if question in _GEMINI_FORM_CACHE:
-        return _GEMINI_FORM_CACHE[question]
-
-    prompt = (
-        f"You are filling out a job application form for Krish Sawhney applying for a junior "
-        f"software/AI engineering role.\n\n"
+    cache = _gemini_cache()
+    key = _gemini_cache_key(question)
+    entry = cache.get(key)
+    if entry and time.time() - entry.get("ts", 0) < _GEMINI_CACHE_TTL:
+        return entry["answer"]
+
+    # Exact miss — try a semantic match against cached embeddings
+    emb = _embed_question(question)
+    if emb:
+        answer = _semantic_lookup(cache, emb)
+        if answer:
+            # Also store under this phrasing's exact key — the next recurrence
+            # skips both the embedding round-trip and the cosine scan
+            _gemini_cache_put(cache, key, answer, emb)
+            return answer
+
+    prompt = _FORM_PROMPT_PREFIX + (
         f"Form question: \"{question}\"\n\n"
-        f"Candidate facts:\n"
-        f"- BSc Computer Science (AI), Brunel University London, 2022-2025\n"
-        f"- AI Intern at IntelliDB: ML pipelines, reduced inference latency 28%, CI/CD automation\n"
-        f"- Skills: Python, TypeScript, React, Node.js, TensorFlow, Hugging Face, Docker, AWS\n"
-        f"- Dissertation: RL traffic signal optimisation (Q-Learning, DQN, OpenAI Gym)\n"
-        f"- 1 year experience, 30-day notice, based in New Delhi, requires visa sponsorship\n\n"
         f"Reply with ONLY the answer (1-3 sentences, first person, professional). No preamble."
     )
     answer = _call_gemini(prompt)
     if answer:
-        _GEMINI_FORM_CACHE[question] = answer
+        _gemini_cache_put(cache, key, answer, emb)
     return answer
 
 
@@ -258,53 +524,222 @@ COMMON_ANSWERS = {
 }
 
 
-def answer_field(page, label_text: str, input_el) -> bool:
-    """Try to fill an input based on its label text."""
-    label_lower = label_text.lower().strip()
-    for key, val in COMMON_ANSWERS.items():
-        if key in label_lower:
-            try:
-                tag = input_el.evaluate("el => el.tagName.toLowerCase()")
-                if tag == "select":
-                    # Try to select by label text first
-                    options = input_el.query_selector_all("option")
-                    for opt in options:
-                        opt_text = opt.inner_text().lower()
-                        if val.lower() in opt_text or opt_text in val.lower():
-                            input_el.select_option(value=opt.get_attribute("value"))
-                            return True
-                    # Fallback: select first non-empty option
-                    input_el.select_option(index=1)
-                    return True
-                elif tag in ("input", "textarea"):
-                    input_type = input_el.get_attribute("type") or "text"
-                    if input_type == "checkbox":
-                        if val.lower() in ("yes", "true", "1"):
-                            if not input_el.is_checked():
-                                input_el.check()
-                        return True
-                    elif input_type == "radio":
-                        return False  # handled separately
-                    else:
-                        input_el.fill(val)
-                        return True
-            except Exception:
-                pass
+# Label matching is a single pass over the text instead of one substring scan
+# per key. Dict order above is the priority order, so of all keys found we
+# answer with the earliest-declared one — same result as the old key loop.
+try:
+    import ahocorasick
+    _ANSWER_AUTOMATON = ahocorasick.Automaton()
+    for _key in COMMON_ANSWERS:
+        _ANSWER_AUTOMATON.add_word(_key, _key)
+    _ANSWER_AUTOMATON.make_automaton()
+except ImportError:
+    _ANSWER_AUTOMATON = None
 
-    # Gemini fallback — answer open-ended text/textarea questions
-    if GEMINI_API_KEY and label_text.strip() and len(label_text.strip()) > 3:
+_ANSWER_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(COMMON_ANSWERS, key=len, reverse=True))
+)
+_ANSWER_RANK = {k: i for i, k in enumerate(COMMON_ANSWERS)}
+
+
+def _match_answer(label_lower: str) -> str | None:
+    if _ANSWER_AUTOMATON is not None:
+        hits = {key for _, key in _ANSWER_AUTOMATON.iter(label_lower)}
+    else:
+        hits = set(_ANSWER_RE.findall(label_lower))
+    if not hits:
+        return None
+    return COMMON_ANSWERS[min(hits, key=_ANSWER_RANK.__getitem__)]
+
+
+# Snapshot every form field in one evaluate call. Each element is tagged with
+# a data-ea-idx attribute so Python can address it later with a single
+# fill/select/check — no per-field tagName/get_attribute round-trips.
+_FORM_SNAPSHOT_JS = """() => {
+    const groups = document.querySelectorAll(
+        '.jobs-easy-apply-form-section__grouping, .fb-form-element, [data-test-form-element]'
+    );
+    const fields = [];
+    let n = 0;
+    groups.forEach(group => {
+        const labelEl = group.querySelector(
+            'label, .fb-form-element-label, [data-test-form-element-label]'
+        );
+        const label = labelEl ? labelEl.innerText : '';
+        const inputs = group.querySelectorAll(
+            "input:not([type='hidden']):not([type='file']), select, textarea"
+        );
+        inputs.forEach(el => {
+            el.setAttribute('data-ea-idx', String(n));
+            const tag = el.tagName.toLowerCase();
+            const field = {
+                selector: '[data-ea-idx="' + n + '"]',
+                tag,
+                type: (el.getAttribute('type') || 'text').toLowerCase(),
+                label,
+                checked: !!el.checked,
+            };
+            if (tag === 'select') {
+                field.options = Array.from(el.options).map(o => ({
+                    value: o.value, text: o.innerText.trim()
+                }));
+            }
+            if (field.type === 'radio') {
+                const rl = el.id ? document.querySelector('label[for="' + el.id + '"]') : null;
+                field.radioLabel = rl ? rl.innerText : '';
+            }
+            fields.push(field);
+            n++;
+        });
+    });
+    return fields;
+}"""
+
+
+# Companies reuse near-identical Easy Apply forms. Answers that led to a
+# successful submit are cached per company (normalized label → value) and
+# consulted before the generic matching / Gemini path on the next application
+# at the same employer.
+FORM_TEMPLATES_PATH = JOB_DIR / "form_templates.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _form_templates() -> dict:
+    if FORM_TEMPLATES_PATH.exists():
         try:
-            tag = input_el.evaluate("el => el.tagName.toLowerCase()")
-            input_type = (input_el.get_attribute("type") or "text").lower()
-            if tag == "textarea" or (tag == "input" and input_type in ("text", "")):
-                ai_answer = _gemini_form_answer(label_text.strip())
-                if ai_answer:
-                    input_el.fill(ai_answer[:2000])
-                    return True
-        except Exception:
+            return json.loads(FORM_TEMPLATES_PATH.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
             pass
+    return {}
+
+
+def _save_form_template(company: str, answers: dict):
+    key = company.strip().lower()
+    if not key or not answers:
+        return
+    templates = _form_templates()
+    templates.setdefault(key, {}).update(answers)
+    try:
+        FORM_TEMPLATES_PATH.write_text(json.dumps(templates), encoding="utf-8")
+    except OSError:
+        pass
+
+
+# Applies a batch of decided answers in one shot: sets .value / .checked and
+# dispatches input+change events so LinkedIn's form listeners fire.
+_APPLY_FIELDS_JS = """(actions) => {
+    const fire = el => {
+        el.dispatchEvent(new Event('input',  {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+    let applied = 0;
+    for (const a of actions) {
+        const el = document.querySelector(a.selector);
+        if (!el) continue;
+        if (a.kind === 'select') {
+            if (a.value !== null) el.value = a.value;
+            else if (el.options.length > 1) el.selectedIndex = 1;
+            fire(el);
+        } else if (a.kind === 'check') {
+            if (!el.checked) el.click();
+        } else {
+            el.value = a.value;
+            fire(el);
+        }
+        applied++;
+    }
+    return applied;
+}"""
 
-    return False
+
+async def fill_form_fields(page, fields: list[dict],
+                           template: dict | None = None,
+                           used: dict | None = None):
+    """Answer a step's fields from one snapshot, applied in one evaluate.
+
+    All decisions happen in Python; the browser sees a single batch of
+    {selector, kind, value} actions instead of one CDP call per field.
+    A per-company template (label → value) short-circuits matching and the
+    Gemini fallback; answers actually used are recorded into `used`.
+    """
+    actions: list[dict] = []
+    radio_groups: dict[str, list[dict]] = {}
+
+    def _answer(label_lower: str) -> str | None:
+        if template is not None:
+            hit = template.get(label_lower)
+            if hit is not None:
+                return hit
+        return _match_answer(label_lower)
+
+    def _record(label_lower: str, val: str):
+        if used is not None and label_lower:
+            used[label_lower] = val
+
+    for field in fields:
+        label = field.get("label", "")
+        label_lower = label.lower().strip()
+        if field.get("type") == "radio":
+            radio_groups.setdefault(label_lower, []).append(field)
+            continue
+
+        val = _answer(label_lower)
+        if field["tag"] == "select":
+            if val is None:
+                continue
+            chosen = None
+            for opt in field.get("options", []):
+                opt_text = opt.get("text", "").lower()
+                if val.lower() in opt_text or opt_text in val.lower():
+                    chosen = opt.get("value")
+                    break
+            # chosen None → the JS side falls back to the first non-empty option
+            actions.append({"selector": field["selector"], "kind": "select", "value": chosen})
+            _record(label_lower, val)
+        elif val is not None:
+            if field["type"] == "checkbox":
+                if val.lower() in ("yes", "true", "1") and not field.get("checked"):
+                    actions.append({"selector": field["selector"], "kind": "check", "value": None})
+                    _record(label_lower, val)
+            else:
+                actions.append({"selector": field["selector"], "kind": "fill", "value": val})
+                _record(label_lower, val)
+        elif (GEMINI_API_KEY and len(label.strip()) > 3
+                and (field["tag"] == "textarea"
+                     or (field["tag"] == "input" and field["type"] in ("text", "")))):
+            # Gemini fallback — answer open-ended text/textarea questions.
+            # The HTTP round-trip is blocking (httpx.Client / urllib), so it
+            # runs on a thread: awaiting it here keeps the other workers'
+            # pages moving instead of freezing the whole event loop.
+            ai_answer = await asyncio.to_thread(_gemini_form_answer, label.strip())
+            if ai_answer:
+                actions.append({"selector": field["selector"], "kind": "fill",
+                                "value": ai_answer[:2000]})
+                _record(label_lower, ai_answer[:2000])
+
+    for label_lower, radios in radio_groups.items():
+        if not label_lower:
+            continue
+        val = _answer(label_lower)
+        if val is None:
+            continue
+        target = None
+        for r in radios:
+            rl = (r.get("radioLabel") or "").lower()
+            if r.get("radioLabel") and (val.lower() in rl or rl in val.lower()):
+                target = r
+                break
+        if target is None:
+            target = radios[0]
+        actions.append({"selector": target["selector"], "kind": "check", "value": None})
+        _record(label_lower, val)
+
+    if actions:
+        try:
+            await page.evaluate(_APPLY_FIELDS_JS, actions)
+        except PWError as e:
+            # Protocol failure, not a per-field quirk — worth seeing in logs
+            logger.warning("form batch apply failed: %s", e)
 
 
 # ── JS helpers for button detection (robust across LinkedIn DOM changes) ───────
@@ -374,29 +809,65 @@ _CLOSE_MODAL_JS = """() => {
 }"""
 
 
+# True once the Easy Apply modal has interactive content
+_MODAL_READY_JS = """() => !!document.querySelector(
+    '.jobs-easy-apply-modal input, .jobs-easy-apply-modal button, ' +
+    'div[role="dialog"] input, div[role="dialog"] button'
+)"""
+
+# Step signature (heading + progress value) — changes when the form advances
+_STEP_SIG_JS = """() => {
+    const m = document.querySelector('.jobs-easy-apply-modal, div[role="dialog"]');
+    if (!m) return '';
+    const h = m.querySelector('h3, h2');
+    const p = m.querySelector('progress, [role="progressbar"]');
+    return (h ? h.innerText : '') + '|' +
+           (p ? (p.value || p.getAttribute('aria-valuenow') || '') : '');
+}"""
+
+
+async def _wait_or_sleep(page, js: str, timeout: int, fallback_ms: int, arg=None):
+    """Event-driven wait with a short fixed sleep as the failure fallback."""
+    try:
+        await page.wait_for_function(js, arg=arg, timeout=timeout)
+    except Exception:
+        await page.wait_for_timeout(fallback_ms)
+
+
 # ── Core apply function ───────────────────────────────────────────────────────
-def apply_to_job(page, job_url: str, job_title: str, company: str,
-                 dry_run: bool = False) -> str:
+async def apply_to_job(page, job_url: str, job_title: str, company: str,
+                       dry_run: bool = False) -> str:
     """
     Returns: 'applied' | 'skipped' | 'dry_run' | 'error:<reason>'
     """
     log_lines = [f"[{datetime.now().isoformat()}] {job_title} @ {company}"]
 
+    # Answers that worked for this company before skip rediscovery entirely
+    template = _form_templates().get(company.strip().lower())
+    used_answers: dict = {}
+
     try:
-        page.goto(job_url, timeout=30000)
+        # Retry a slow first navigation once instead of failing the job
+        for attempt in range(2):
+            try:
+                await page.goto(job_url)
+                break
+            except PWTimeout:
+                if attempt:
+                    raise
 
         # Wait for the job detail panel to settle
         try:
-            page.wait_for_selector(
+            await page.wait_for_selector(
                 "button.jobs-apply-button, [aria-label*='Easy Apply'], "
                 "[data-control-name='jobdetails_topcard_inapply']",
                 timeout=8000
             )
         except PWTimeout:
-            page.wait_for_timeout(3000)
+            await page.wait_for_timeout(3000)
 
         # Find Easy Apply button via JS (more reliable than CSS selector)
-        easy_apply_btn = page.evaluate("""() => {
+        easy_apply_btn = await page.evaluate("""() => {
             const btns = Array.from(document.querySelectorAll('button'));
             return btns.find(b => {
                 const al  = (b.getAttribute('aria-label') || '').toLowerCase();
@@ -406,15 +877,15 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
         }""")
 
         if not easy_apply_btn:
-            # Double-check with Playwright selector as fallback
-            el = page.query_selector("[aria-label*='Easy Apply'], button.jobs-apply-button")
-            if not el:
+            # Double-check with Playwright locator as fallback
+            btn_loc = page.locator("[aria-label*='Easy Apply'], button.jobs-apply-button")
+            if not await btn_loc.count():
                 log_lines.append("  → No Easy Apply button — external application, skipping")
                 return "skipped"
-            el.click()
+            await btn_loc.first.click()
         else:
             # Click via JS handle
-            page.evaluate("""() => {
+            await page.evaluate("""() => {
                 const btns = Array.from(document.querySelectorAll('button'));
                 const btn = btns.find(b => {
                     const al  = (b.getAttribute('aria-label') || '').toLowerCase();
@@ -428,12 +899,12 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
 
         if dry_run:
             log_lines.append("  → DRY RUN — not proceeding")
-            page.evaluate(_CLOSE_MODAL_JS)
+            await page.evaluate(_CLOSE_MODAL_JS)
             return "dry_run"
 
         # Wait for the Easy Apply modal to open
         try:
-            page.wait_for_selector(
+            await page.wait_for_selector(
                 ".jobs-easy-apply-modal, [data-test-modal-id], "
                 "div[role='dialog']",
                 timeout=6000
@@ -442,11 +913,11 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
             log_lines.append("  → Easy Apply modal did not open")
             return "skipped"
 
-        page.wait_for_timeout(1000)
+        await _wait_or_sleep(page, _MODAL_READY_JS, timeout=3000, fallback_ms=1000)
 
         # Verify the dialog actually contains Easy Apply form content —
         # not just a nav dropdown or unrelated overlay that happens to be role=dialog
-        has_form_content = page.evaluate("""() => {
+        has_form_content = await page.evaluate("""() => {
             const selectors = [
                 '.jobs-easy-apply-modal',
                 '[data-test-modal-id]',
@@ -473,78 +944,60 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
             log_lines.append("  → Dialog matched but no form content (nav dropdown / external redirect)")
             return "skipped"
 
-        # Multi-step form loop (up to 10 steps)
+        # Multi-step form loop (up to 10 steps). The CV and cover letter each
+        # appear on one step — once handled, later steps skip those scans.
+        cv_uploaded  = False
+        cover_filled = False
         for step in range(10):
             log_lines.append(f"  → Step {step + 1}")
 
             # Upload CV if asked
-            file_inputs = page.query_selector_all("input[type='file']")
-            for fi in file_inputs:
-                if Path(CV_PATH).exists():
+            if not cv_uploaded and Path(CV_PATH).exists():
+                file_loc = page.locator("input[type='file']")
+                for i in range(await file_loc.count()):
                     try:
-                        fi.set_input_files(CV_PATH)
+                        await file_loc.nth(i).set_input_files(CV_PATH)
                         log_lines.append("  → Uploaded CV")
-                        page.wait_for_timeout(1000)
-                    except Exception:
-                        pass
-
-            # Fill text/select/radio fields
-            form_groups = page.query_selector_all(
-                ".jobs-easy-apply-form-section__grouping, .fb-form-element, "
-                "[data-test-form-element]"
-            )
-            for group in form_groups:
-                try:
-                    label_el = group.query_selector(
-                        "label, .fb-form-element-label, [data-test-form-element-label]"
-                    )
-                    label_text = label_el.inner_text() if label_el else ""
+                        cv_uploaded = True
+                        await page.wait_for_timeout(1000)
+                    except PWError as e:
+                        logger.warning("CV upload failed: %s", e)
 
-                    inputs = group.query_selector_all(
-                        "input:not([type='hidden']):not([type='file']), select, textarea"
-                    )
-                    for inp in inputs:
-                        answer_field(page, label_text, inp)
-
-                    # Handle radio buttons
-                    radios = group.query_selector_all("input[type='radio']")
-                    if radios and label_text:
-                        label_lower = label_text.lower()
-                        for key, val in COMMON_ANSWERS.items():
-                            if key in label_lower:
-                                for radio in radios:
-                                    radio_label = page.query_selector(
-                                        f"label[for='{radio.get_attribute('id')}']"
-                                    )
-                                    if radio_label:
-                                        rl = radio_label.inner_text().lower()
-                                        if val.lower() in rl or rl in val.lower():
-                                            radio.click()
-                                            break
-                                else:
-                                    radios[0].click()
-                                break
-                except Exception:
-                    pass
+            # Fill text/select/radio fields — one snapshot round-trip for the
+            # whole step, then one action call per answered field
+            try:
+                fields = await page.evaluate(_FORM_SNAPSHOT_JS)
+            except Exception:
+                fields = []
+            await fill_form_fields(page, fields, template=template, used=used_answers)
 
             # Cover letter textarea
-            cover_textareas = page.query_selector_all(
-                "textarea[id*='cover'], textarea[name*='cover'], "
-                ".jobs-easy-apply-form-section textarea"
+            if not cover_filled:
+                cover_loc = page.locator(
+                    "textarea[id*='cover'], textarea[name*='cover'], "
+                    ".jobs-easy-apply-form-section textarea"
+                )
+                if await cover_loc.count():
+                    cl = get_cover_letter(job_title)
+                    if cl:
+                        try:
+                            await cover_loc.first.fill(cl)
+                            cover_filled = True
+                            log_lines.append("  → Filled cover letter")
+                        except PWError as e:
+                            logger.warning("cover letter fill failed: %s", e)
+
+            await _wait_or_sleep(
+                page,
+                """() => {
+                    const m = document.querySelector('.jobs-easy-apply-modal, div[role="dialog"]');
+                    return m && !!m.querySelector('button:not([disabled])');
+                }""",
+                timeout=1500, fallback_ms=600,
             )
-            if cover_textareas:
-                cl = get_cover_letter(job_title)
-                if cl:
-                    try:
-                        cover_textareas[0].fill(cl)
-                        log_lines.append("  → Filled cover letter")
-                    except Exception:
-                        pass
-
-            page.wait_for_timeout(600)
 
             # Find navigation button via JS (handles any aria-label LinkedIn uses)
-            nav = page.evaluate(_FIND_NAV_BTN_JS)
+            nav = await page.evaluate(_FIND_NAV_BTN_JS)
             log_lines.append(f"  → Nav found: {nav}")
 
             if nav is None or nav.get("action") is None:
@@ -556,7 +1009,7 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
 
             if action == "submit":
                 # Click submit via JS
-                page.evaluate("""() => {
+                await page.evaluate("""() => {
                     const btns = Array.from(document.querySelectorAll('button'));
                     const s = ['submit application', 'submit'];
                     const btn = btns.find(b => {
@@ -566,14 +1019,27 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
                     });
                     if (btn) btn.click();
                 }""")
-                page.wait_for_timeout(2500)
+                # Wait on the actual confirmation (dismiss button / "sent"
+                # banner) rather than a fixed delay
+                try:
+                    await page.wait_for_selector(
+                        "button[aria-label='Dismiss'], "
+                        "h2:has-text('application was sent'), "
+                        "h3:has-text('application was sent')",
+                        timeout=5000,
+                    )
+                except Exception:
+                    await page.wait_for_timeout(1500)
                 log_lines.append("  ✓ Application submitted!")
+                # These answers got through — remember them for this company
+                _save_form_template(company, used_answers)
                 # Dismiss confirmation modal
-                page.evaluate(_CLOSE_MODAL_JS)
+                await page.evaluate(_CLOSE_MODAL_JS)
                 return "applied"
 
             elif action in ("review", "next"):
-                page.evaluate(f"""() => {{
+                step_sig = await page.evaluate(_STEP_SIG_JS)
+                await page.evaluate(f"""() => {{
                     const btns = Array.from(document.querySelectorAll('button'));
                     const labels = {json.dumps(['review your application', 'review', 'continue to next step', 'next', 'continue'] if action == 'review' else ['continue to next step', 'next', 'continue'])};
                     const btn = btns.find(b => {{
@@ -583,34 +1049,106 @@ def apply_to_job(page, job_url: str, job_title: str, company: str,
                     }});
                     if (btn) btn.click();
                 }}""")
-                page.wait_for_timeout(1500)
+                await _wait_or_sleep(
+                    page, f"prev => ({_STEP_SIG_JS})() !== prev",
+                    timeout=3000, fallback_ms=1500, arg=step_sig,
+                )
 
         # Didn't reach submit — close the modal cleanly
-        page.evaluate(_CLOSE_MODAL_JS)
+        await page.evaluate(_CLOSE_MODAL_JS)
         return "error:no_submit_reached"
 
     except PWTimeout:
         log_lines.append("  → Timeout")
         try:
-            page.evaluate(_CLOSE_MODAL_JS)
+            await page.evaluate(_CLOSE_MODAL_JS)
         except Exception:
             pass
         return "error:timeout"
     except Exception as e:
         log_lines.append(f"  → Exception: {e}")
         try:
-            page.evaluate(_CLOSE_MODAL_JS)
+            await page.evaluate(_CLOSE_MODAL_JS)
         except Exception:
             pass
         return f"error:{str(e)[:80]}"
     finally:
-        log_file = LOG_DIR / f"apply_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        log_file.write_text("\n".join(log_lines), encoding="utf-8")
+        # One multi-line record per job keeps the per-job lines grouped even
+        # with concurrent workers interleaving
+        logger.info("%s", "\n".join(log_lines))
 
 
 # ── LinkedIn job search ───────────────────────────────────────────────────────
-def search_linkedin_jobs(page, role: str, geo_id: str, location: str,
-                         max_results: int = 25) -> list[dict]:
+async def _search_jobs_api(context, role: str, geo_id: str, location: str,
+                           max_results: int) -> list[dict]:
+    """Query LinkedIn's Voyager search API directly — no rendering, no scrolls.
+
+    Uses the context's APIRequestContext with the session's csrf token
+    (JSESSIONID cookie, quotes stripped). Returns [] on any failure so the
+    caller can fall back to HTML scraping.
+    """
+    import urllib.parse
+    try:
+        cookies = await context.cookies("https://www.linkedin.com")
+        csrf = next(
+            (c["value"] for c in cookies if c["name"] == "JSESSIONID"), ""
+        ).strip('"')
+        if not csrf:
+            return []
+        query = (
+            f"(origin:JOB_SEARCH_PAGE_JOB_FILTER,keywords:{urllib.parse.quote(role)},"
+            f"locationUnion:(geoId:{geo_id}),"
+            f"selectedFilters:(applyWithLinkedin:List(true),experience:List(1,2)),"
+            f"spellCorrectionEnabled:true)"
+        )
+        resp = await context.request.get(
+            "https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards"
+            f"?decorationId=com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-187"
+            f"&q=jobSearch&query={query}&start=0&count={max_results}",
+            headers={
+                "csrf-token": csrf,
+                "accept": "application/vnd.linkedin.normalized+json+2.1",
+            },
+        )
+        if resp.status != 200:
+            return []
+        data = await resp.json()
+    except Exception:
+        return []
+
+    # normalized+json: companies and postings arrive as flat "included" entities
+    companies = {}
+    postings = []
+    for el in data.get("included", []):
+        etype = el.get("$type", "")
+        if etype.endswith(".Company"):
+            companies[el.get("entityUrn", "")] = el.get("name", "")
+        elif etype.endswith(".JobPosting"):
+            postings.append(el)
+
+    jobs = []
+    for el in postings[:max_results]:
+        m = re.search(r"(\d+)", el.get("entityUrn", ""))
+        if not m or not el.get("title"):
+            continue
+        jobs.append({
+            "title":    el.get("title", ""),
+            "company":  companies.get(el.get("companyDetails", {}).get("company", ""), ""),
+            "location": el.get("formattedLocation", "") or location,
+            "url":      f"https://www.linkedin.com/jobs/view/{m.group(1)}/",
+            "region":   "",
+        })
+    return jobs
+
+
+async def search_linkedin_jobs(page, role: str, geo_id: str, location: str,
+                               max_results: int = 25) -> list[dict]:
+    # Fast path: Voyager JSON API — a fraction of the bytes and CPU of a
+    # rendered search page
+    jobs = await _search_jobs_api(page.context, role, geo_id, location, max_results)
+    if jobs:
+        return jobs
+
     import urllib.parse
     params = {
         "keywords":   role,
@@ -622,26 +1160,37 @@ def search_linkedin_jobs(page, role: str, geo_id: str, location: str,
         "start":      "0",
     }
     url = "https://www.linkedin.com/jobs/search/?" + urllib.parse.urlencode(params)
-    page.goto(url, timeout=30000)
+    await page.goto(url)
 
     # Wait for job cards — [data-job-id] is stable across LinkedIn DOM changes
     try:
-        page.wait_for_selector("[data-job-id]", timeout=10000)
+        await page.wait_for_selector("[data-job-id]", timeout=10000)
     except PWTimeout:
         # No results or page structure changed — try generic list wait
-        page.wait_for_timeout(4000)
+        await page.wait_for_timeout(4000)
 
-    # Scroll to load more results
+    # Scroll to load more results — stop as soon as enough cards are present
+    # or a scroll stops producing new ones
     for _ in range(4):
-        page.evaluate("window.scrollBy(0, window.innerHeight)")
-        page.wait_for_timeout(800)
+        count = await page.evaluate("() => document.querySelectorAll('[data-job-id]').length")
+        if count >= max_results:
+            break
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
+        try:
+            await page.wait_for_function(
+                "n => document.querySelectorAll('[data-job-id]').length > n",
+                arg=count, timeout=2000,
+            )
+        except PWTimeout:
+            break
 
-    # Extract job data via JavaScript — avoids brittle class-name selectors
-    raw_jobs = page.evaluate("""() => {
+    # Extract job data via JavaScript — avoids brittle class-name selectors.
+    # max_results caps the walk in-browser so excess cards are never serialized.
+    raw_jobs = await page.evaluate("""(max) => {
         const results = [];
 
         // Primary: cards with data-job-id (logged-in search results page)
-        const cards = document.querySelectorAll('[data-job-id]');
+        const cards = Array.from(document.querySelectorAll('[data-job-id]')).slice(0, max);
         cards.forEach(card => {
             const jobId = card.getAttribute('data-job-id') || card.getAttribute('data-entity-urn') || '';
 
@@ -696,9 +1245,9 @@ def search_linkedin_jobs(page, role: str, geo_id: str, location: str,
 
         // Fallback: list items in the jobs results panel
         if (results.length === 0) {
-            const items = document.querySelectorAll(
+            const items = Array.from(document.querySelectorAll(
                 '.jobs-search-results__list-item, li.scaffold-layout__list-item'
-            );
+            )).slice(0, max);
             items.forEach(item => {
                 const titleEl = item.querySelector('a[id*="job-card"], a[href*="/jobs/view/"]');
                 const title = titleEl ? titleEl.innerText.trim() : '';
@@ -717,11 +1266,11 @@ def search_linkedin_jobs(page, role: str, geo_id: str, location: str,
         }
 
         return results;
-    }""")
+    }""", max_results)
 
     jobs = []
     seen_urls = set()
-    for item in raw_jobs[:max_results]:
+    for item in raw_jobs:
         href = item.get("href", "")
         if not href or href in seen_urls:
             continue
@@ -738,130 +1287,303 @@ def search_linkedin_jobs(page, role: str, geo_id: str, location: str,
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--region",   default="uk",   help="uk | india | germany | netherlands | uae | all")
-    parser.add_argument("--role",     default="all",  help="Specific role or 'all'")
-    parser.add_argument("--max",      type=int, default=20, help="Max applications per run")
-    parser.add_argument("--dry-run",  action="store_true",  help="Find jobs but don't submit")
-    args = parser.parse_args()
+_LI_COOKIE = {
+    "name":   "li_at",
+    "domain": ".linkedin.com",
+    "path":   "/",
+    "secure": True,
+}
 
-    if not LI_AT:
-        print("[ERROR] LINKEDIN_LI_AT env var not set.")
-        sys.exit(1)
 
-    if not Path(CV_PATH).exists():
-        print(f"[WARN] CV not found at {CV_PATH}")
-        print("  Run: echo $CV_BASE64 | base64 -d > " + CV_PATH)
-        if not args.dry_run:
-            print("  CV is required for non-dry-run. Continuing anyway (some jobs don't need it).")
+# None of these are read by the scraper — dropping them cuts most of the
+# bytes LinkedIn serves per navigation. Stylesheets stay: the button matchers
+# rely on getBoundingClientRect() to tell real controls from hidden ones, and
+# without CSS every display:none remnant reports a non-zero rect.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Ad/analytics beacons — pure overhead for the automation
+_BLOCKED_URL_SNIPPETS = (
+    "px.ads.linkedin.com",
+    "/li/track",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+
+async def _route_filter(route):
+    req = route.request
+    if (req.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(s in req.url for s in _BLOCKED_URL_SNIPPETS)):
+        await route.abort()
+    else:
+        await route.continue_()
 
+
+# Saved cookies + localStorage from the previous run; reloading this keeps the
+# session warm so LinkedIn skips its first-navigation JS bootstrap.
+_STATE_PATH    = JOB_DIR / "li_state.json"
+_STATE_MAX_AGE = 24 * 3600
+
+
+def _state_fresh(max_age: int = _STATE_MAX_AGE) -> bool:
+    try:
+        return time.time() - _STATE_PATH.stat().st_mtime < max_age
+    except OSError:
+        return False
+
+
+async def _new_li_context(browser):
+    """Create a BrowserContext seeded with the LinkedIn session cookie."""
+    kwargs = {
+        "viewport": {"width": 1280, "height": 800},
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    }
+    if _state_fresh():
+        kwargs["storage_state"] = str(_STATE_PATH)
+    context = await browser.new_context(**kwargs)
+    if "storage_state" not in kwargs:
+        await context.add_cookies([dict(_LI_COOKIE, value=LI_AT)])
+    await context.route("**/*", _route_filter)
+    # Tight defaults — a stuck edge page shouldn't stall a worker for 30s.
+    # Calls that genuinely need longer (initial feed verify) override per-call.
+    context.set_default_navigation_timeout(15000)
+    context.set_default_timeout(5000)
+    return context
+
+
+# Guards against the same posting surfacing from several role/region searches
+# in one run — a set lookup instead of a ~3s page navigation per duplicate.
+_APPLIED_THIS_RUN: set[str] = set()
+
+
+async def _apply_worker(context, sem, job, dry_run: bool,
+                        counters: dict, applied_urls: set, max_apply: int):
+    """Run one application in its own page; contexts are reused across jobs."""
+    async with sem:
+        if counters["applied"] >= max_apply:
+            return
+        url = job["url"]
+        if url[:60] in _APPLIED_THIS_RUN or url[:60] in applied_urls:
+            counters["skipped"] += 1
+            return
+        _APPLIED_THIS_RUN.add(url[:60])
+        print(f"  → #{counters['applied']+1} {job['title']} @ {job['company']}")
+
+        page = await context.new_page()
+        try:
+            result = await apply_to_job(
+                page, url, job["title"], job["company"], dry_run=dry_run
+            )
+        finally:
+            await page.close()
+
+        if result == "applied":
+            print(f"    ✓ Applied!")
+            job["status"] = "applied"
+            job["notes"]  = f"LinkedIn Easy Apply | {datetime.now().strftime('%Y-%m-%d')}"
+            async with _TRACKER_LOCK:
+                add_to_tracker(job)
+                _record_applied(url)
+            applied_urls.add(url[:60])
+            counters["applied"] += 1
+        elif result == "dry_run":
+            print(f"    ○ [DRY RUN] Would apply")
+            counters["applied"] += 1
+        elif result == "skipped":
+            print(f"    ↷ Skipped (external/no modal)")
+            counters["skipped"] += 1
+        else:
+            print(f"    ✗ {result}")
+            counters["errors"] += 1
+
+        # Polite delay between applications (per worker)
+        await asyncio.sleep(random.uniform(3, 7))
+
+
+async def run(args):
     regions = list(REGION_CONFIGS.keys()) if args.region == "all" else [args.region.lower()]
     roles   = SEARCH_ROLES if args.role == "all" else [args.role]
 
-    existing_tracker = load_tracker()
-    applied_urls = {url for url, row in existing_tracker.items() if row.get("status") == "applied"}
+    # dbm sidecar of applied prefixes — tracker.csv is only parsed to seed it
+    applied_db = _open_applied_db()
+    applied_urls = {k.decode() if isinstance(k, bytes) else k for k in applied_db.keys()}
 
-    applied_count = 0
-    skipped_count = 0
-    error_count   = 0
+    counters = {"applied": 0, "skipped": 0, "errors": 0}
 
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(
+    async with async_playwright() as pw:
+        # Flags trimmed for a headless container: no background timers or
+        # networking, no image decode (the route filter already blocks the
+        # requests), no per-site renderer processes eating RAM
+        browser = await pw.chromium.launch(
             headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
-        )
-        context = browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            args=[
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                # Kept deliberately: the Railway container has no GPU, and
+                # without the flag Chromium probes for one and falls back to
+                # SwiftShader, spending startup time and RAM on a software GL
+                # stack nothing here renders with
+                "--disable-gpu",
+                "--disable-extensions",
+                "--disable-background-networking",
+                "--disable-background-timer-throttling",
+                "--disable-renderer-backgrounding",
+                "--disable-features=Translate,IsolateOrigins,site-per-process",
+                "--blink-settings=imagesEnabled=false",
+                "--mute-audio",
+                "--no-first-run",
+            ],
         )
-
-        # Inject LinkedIn session cookie
-        context.add_cookies([{
-            "name":   "li_at",
-            "value":  LI_AT,
-            "domain": ".linkedin.com",
-            "path":   "/",
-            "secure": True,
-        }])
-
-        page = context.new_page()
-
-        # Verify we're logged in
-        page.goto("https://www.linkedin.com/feed/", timeout=30000)
-        page.wait_for_timeout(2000)
-        if "login" in page.url or "authwall" in page.url:
-            print("[ERROR] LinkedIn session expired — li_at cookie is invalid or expired.")
-            print("  Refresh your li_at cookie from browser dev tools and update the Railway env var.")
-            browser.close()
-            sys.exit(1)
+        # One context per worker — reused across jobs (only pages are closed)
+        n_contexts = min(CONCURRENCY, max(1, args.max))
+        contexts = [await _new_li_context(browser) for _ in range(n_contexts)]
+        sem = asyncio.Semaphore(n_contexts)
+
+        # Verify we're logged in. A session state saved within the last 12h
+        # means the cookie was valid very recently — skip the feed round-trip.
+        session_verified = False
+        if not _state_fresh(12 * 3600):
+            used_state = _state_fresh()
+            page = await contexts[0].new_page()
+            await page.goto("https://www.linkedin.com/feed/", timeout=30000)
+            await page.wait_for_timeout(2000)
+            if ("login" in page.url or "authwall" in page.url) and used_state:
+                # The saved state is stale but LINKEDIN_LI_AT may have been
+                # refreshed since — drop the state, rebuild the contexts from
+                # the env cookie and check once more before giving up.
+                _STATE_PATH.unlink(missing_ok=True)
+                await page.close()
+                for ctx in contexts:
+                    await ctx.close()
+                contexts = [await _new_li_context(browser) for _ in range(n_contexts)]
+                page = await contexts[0].new_page()
+                await page.goto("https://www.linkedin.com/feed/", timeout=30000)
+                await page.wait_for_timeout(2000)
+            if "login" in page.url or "authwall" in page.url:
+                # Drop the stale state file so the next run re-verifies fully
+                _STATE_PATH.unlink(missing_ok=True)
+                print("[ERROR] LinkedIn session expired — li_at cookie is invalid or expired.")
+                print("  Refresh your li_at cookie from browser dev tools and update the Railway env var.")
+                await browser.close()
+                sys.exit(1)
+            session_verified = True
+            await page.close()
 
         print(f"\n✓ Logged into LinkedIn as {P['personal']['name']}")
         print(f"  Mode    : {'DRY RUN' if args.dry_run else 'LIVE — WILL SUBMIT'}")
         print(f"  Regions : {', '.join(regions)}")
-        print(f"  Max     : {args.max} applications\n")
+        print(f"  Max     : {args.max} applications ({n_contexts} workers)\n")
 
-        for region in regions:
-            cfg = REGION_CONFIGS.get(region)
-            if not cfg:
-                print(f"[SKIP] Unknown region: {region}")
-                continue
+        # Search→apply pipeline: a producer searches region after region and
+        # feeds a bounded queue while one consumer per context drains it, so
+        # later searches overlap with earlier applications.
+        jobs_q: asyncio.Queue = asyncio.Queue(maxsize=50)
 
-            for role in roles:
-                if applied_count >= args.max:
+        async def _search_role(i: int, role: str, cfg: dict):
+            page = await contexts[i % n_contexts].new_page()
+            try:
+                return await search_linkedin_jobs(
+                    page, role, cfg["geo_id"], cfg["location"]
+                )
+            finally:
+                await page.close()
+
+        async def _producer():
+            seen = set()
+            for region in regions:
+                cfg = REGION_CONFIGS.get(region)
+                if not cfg:
+                    print(f"[SKIP] Unknown region: {region}")
+                    continue
+
+                if counters["applied"] >= args.max:
                     break
 
-                print(f"[Searching] {role.title()} in {cfg['location']}...")
-                jobs = search_linkedin_jobs(page, role, cfg["geo_id"], cfg["location"])
-                print(f"  Found {len(jobs)} Easy Apply jobs")
+                # All roles for a region are searched concurrently, one page
+                # per worker context
+                print(f"[Searching] {len(roles)} roles in {cfg['location']}...")
+                results = await asyncio.gather(
+                    *[_search_role(i, role, cfg) for i, role in enumerate(roles)],
+                    return_exceptions=True,
+                )
+
+                for role, res in zip(roles, results):
+                    if isinstance(res, BaseException):
+                        print(f"  [WARN] Search failed for {role.title()}: {res}")
+                        continue
+                    print(f"  Found {len(res)} Easy Apply jobs for {role.title()}")
+                    for job in res:
+                        url = job["url"]
+                        if url in seen:
+                            continue
+                        seen.add(url)
+
+                        # Skip already applied — O(1) prefix lookup
+                        if url[:60] in applied_urls:
+                            counters["skipped"] += 1
+                            continue
+
+                        job["region"] = region
+                        await jobs_q.put(job)
+
+            for _ in range(n_contexts):
+                await jobs_q.put(None)  # one sentinel per consumer
+
+        async def _consumer(context):
+            while True:
+                job = await jobs_q.get()
+                if job is None:
+                    break
+                await _apply_worker(
+                    context, sem, job, args.dry_run,
+                    counters, applied_urls, args.max
+                )
+
+        await asyncio.gather(_producer(), *[_consumer(ctx) for ctx in contexts])
+
+        # Persist the warmed session for the next run — but only when this run
+        # proved the session works (verified feed login or a submission that
+        # went through). Saving on a failed run would refresh the state file's
+        # mtime and mask a rotated LINKEDIN_LI_AT for up to a day.
+        if session_verified or counters["applied"] > 0:
+            try:
+                await contexts[0].storage_state(path=str(_STATE_PATH))
+            except Exception:
+                pass
 
-                for job in jobs:
-                    if applied_count >= args.max:
-                        break
+        await browser.close()
 
-                    job["region"] = region
-                    url = job["url"]
+    print(f"\n{'='*50}")
+    print(f"  Applied  : {counters['applied']}")
+    print(f"  Skipped  : {counters['skipped']}")
+    print(f"  Errors   : {counters['errors']}")
+    print(f"  Logs     : {LOG_DIR}")
+    print(f"{'='*50}\n")
 
-                    # Skip already applied
-                    if any(url[:60] in k for k in applied_urls):
-                        skipped_count += 1
-                        continue
 
-                    print(f"  → #{applied_count+1} {job['title']} @ {job['company']}")
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--region",   default="uk",   help="uk | india | germany | netherlands | uae | all")
+    parser.add_argument("--role",     default="all",  help="Specific role or 'all'")
+    parser.add_argument("--max",      type=int, default=20, help="Max applications per run")
+    parser.add_argument("--dry-run",  action="store_true",  help="Find jobs but don't submit")
+    args = parser.parse_args()
+
+    if not LI_AT:
+        print("[ERROR] LINKEDIN_LI_AT env var not set.")
+        sys.exit(1)
 
-                    result = apply_to_job(
-                        page, url, job["title"], job["company"],
-                        dry_run=args.dry_run
-                    )
+    _get_playwright()
+    _setup_run_log()
 
-                    if result == "applied":
-                        print(f"    ✓ Applied!")
-                        job["status"] = "applied"
-                        job["notes"]  = f"LinkedIn Easy Apply | {datetime.now().strftime('%Y-%m-%d')}"
-                        add_to_tracker(job)
-                        applied_urls.add(url[:60])
-                        applied_count += 1
-                    elif result == "dry_run":
-                        print(f"    ○ [DRY RUN] Would apply")
-                        applied_count += 1
-                    elif result == "skipped":
-                        print(f"    ↷ Skipped (external/no modal)")
-                        skipped_count += 1
-                    else:
-                        print(f"    ✗ {result}")
-                        error_count += 1
-
-                    # Polite delay between applications
-                    time.sleep(random.uniform(3, 7))
-
-        browser.close()
+    if not Path(CV_PATH).exists():
+        print(f"[WARN] CV not found at {CV_PATH}")
+        print("  Run: echo $CV_BASE64 | base64 -d > " + CV_PATH)
+        if not args.dry_run:
+            print("  CV is required for non-dry-run. Continuing anyway (some jobs don't need it).")
 
-    print(f"\n{'='*50}")
-    print(f"  Applied  : {applied_count}")
-    print(f"  Skipped  : {skipped_count}")
-    print(f"  Errors   : {error_count}")
-    print(f"  Logs     : {LOG_DIR}")
-    print(f"{'='*50}\n")
+    asyncio.run(run(args))
 
 
 if __name__ == "__main__":
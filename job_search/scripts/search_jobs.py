@@ -10,22 +10,43 @@ Usage (inside Railway container):
   python3 /data/workspace/job_search/scripts/search_jobs.py --role "ai engineer"
 """
 
+import argparse
 import json
 import csv
 import os
+import re
 import sys
 import time
+import hashlib
+import functools
+import threading
 import urllib.request
 import urllib.parse
 import urllib.error
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 
+# orjson parses the tens-of-KB API responses several times faster than the
+# stdlib decoder and skips the intermediate str decode; optional dep.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fetch tasks run concurrently — the workload is network-RTT bound, so
+# overlapping the blocking urllib calls cuts wall time roughly by the
+# worker count. Kept modest to stay friendly with the free API tiers.
+MAX_FETCH_WORKERS = 8
+
 # ── Paths ─────────────────────────────────────────────────────────────────────
 SCRIPT_DIR   = Path(__file__).parent
 JOB_DIR      = SCRIPT_DIR.parent
 PROFILE_PATH = JOB_DIR / "profile.json"
 TRACKER_PATH = JOB_DIR / "tracker.csv"
+TRACKER_KEYS_PATH = JOB_DIR / "tracker.keys"  # dedup sidecar: one "title\tcompany" per row
 LEADS_DIR    = JOB_DIR / "leads"
 LEADS_DIR.mkdir(exist_ok=True)
 
@@ -68,56 +89,151 @@ HEADERS = {
     "Accept": "application/json",
 }
 
+# Per-host pacing replaces the blanket 0.5s sleep after every call:
+# independent hosts no longer serialize behind each other, while each host
+# still sees at most one request per interval across all worker threads.
+_HOST_MIN_INTERVAL = 0.5
+_HOST_LOCKS: dict[str, "threading.Lock"] = defaultdict(threading.Lock)
+_HOST_LAST: dict[str, float] = {}
+
+
+def _throttle(url: str):
+    host = urllib.parse.urlsplit(url).netloc
+    with _HOST_LOCKS[host]:
+        wait = _HOST_LAST.get(host, 0.0) + _HOST_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _HOST_LAST[host] = time.monotonic()
+
+
+# Raw responses are cached on disk keyed by URL + current hour — re-runs
+# while debugging cost zero network, and the daily cron always lands in a
+# fresh bucket so production behaviour is unchanged.
+_HTTP_CACHE_DIR = JOB_DIR / ".http_cache"
+
+
+def _http_cache_path(url: str) -> Path:
+    bucket = datetime.now(timezone.utc).strftime("%Y%m%d%H")
+    return _HTTP_CACHE_DIR / f"{hashlib.sha1((bucket + url).encode()).hexdigest()}.json"
+
+
+def _prune_http_cache(max_age: int = 86400):
+    """Drop cache entries from old hour buckets."""
+    now = time.time()
+    try:
+        for p in _HTTP_CACHE_DIR.iterdir():
+            if now - p.stat().st_mtime > max_age:
+                p.unlink(missing_ok=True)
+    except OSError:
+        pass
+
 
 def fetch_json(url: str, timeout: int = 15) -> dict | None:
-    req = urllib.request.Request(url, headers=HEADERS)
+    cache_path = _http_cache_path(url)
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"  [HTTP {e.code}] {url}")
-        return None
-    except Exception as e:
-        print(f"  [ERR] {e} — {url}")
-        return None
+        raw = cache_path.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        pass
+
+    req = urllib.request.Request(url, headers=HEADERS)
+    for attempt in range(3):
+        _throttle(url)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                raw = resp.read()
+            try:
+                _HTTP_CACHE_DIR.mkdir(exist_ok=True)
+                cache_path.write_bytes(raw)
+            except OSError:
+                pass
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except urllib.error.HTTPError as e:
+            if e.code == 429 and attempt < 2:
+                # Rate limited — back off exponentially and retry
+                time.sleep(2 ** attempt)
+                continue
+            print(f"  [HTTP {e.code}] {url}")
+            return None
+        except Exception as e:
+            print(f"  [ERR] {e} — {url}")
+            return None
+    return None
+
+
+# ── Job record ────────────────────────────────────────────────────────────────
+class Job:
+    """One job lead. Slotted — thousands are allocated per run, and the
+    slotted layout is roughly a third the size of a per-job dict."""
+
+    __slots__ = ("source", "title", "company", "location", "url", "salary",
+                 "posted", "region", "role_query", "_score", "_key")
+
+    def __init__(self, source, title, company, location, url, salary, posted,
+                 region, role_query):
+        self.source     = source
+        self.title      = title
+        self.company    = company
+        self.location   = location
+        self.url        = url
+        self.salary     = salary
+        self.posted     = posted
+        self.region     = region
+        self.role_query = role_query
+        self._score     = 0
+        self._key       = None
+
+    def _asdict(self) -> dict:
+        return {s: getattr(self, s) for s in self.__slots__ if not s.startswith("_")}
 
 
 # ── Source 1: Adzuna API ──────────────────────────────────────────────────────
-def search_adzuna(role: str, country_code: str, max_pages: int = 3) -> list[dict]:
+# The credential/format params never change within a run — built once here,
+# only "what" (the role) varies per query.
+_ADZUNA_BASE_PARAMS = {"results_per_page": 20, "content-type": "application/json"}
+if ADZUNA_APP_ID and ADZUNA_APP_KEY:
+    _ADZUNA_BASE_PARAMS["app_id"]  = ADZUNA_APP_ID
+    _ADZUNA_BASE_PARAMS["app_key"] = ADZUNA_APP_KEY
+
+
+def search_adzuna(role: str, country_code: str, max_pages: int = 3) -> list[Job]:
+    qs = urllib.parse.urlencode({**_ADZUNA_BASE_PARAMS, "what": role})
+
+    # Request all pages up front and gather — the per-host throttle still
+    # paces them, but the round-trips overlap instead of summing
+    urls = [
+        f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/{page}?{qs}"
+        for page in range(1, max_pages + 1)
+    ]
+    if len(urls) == 1:
+        pages = [fetch_json(urls[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            pages = list(pool.map(fetch_json, urls))
+
     jobs = []
-    for page in range(1, max_pages + 1):
-        params = {
-            "results_per_page": 20,
-            "what": role,
-            "content-type": "application/json",
-        }
-        if ADZUNA_APP_ID and ADZUNA_APP_KEY:
-            params["app_id"]  = ADZUNA_APP_ID
-            params["app_key"] = ADZUNA_APP_KEY
-
-        qs  = urllib.parse.urlencode(params)
-        url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/{page}?{qs}"
-        data = fetch_json(url)
+    for data in pages:
         if not data or "results" not in data:
-            break
+            break  # stop-on-empty, applied after the gather
         for item in data["results"]:
-            jobs.append({
-                "source":    "adzuna",
-                "title":     item.get("title", ""),
-                "company":   item.get("company", {}).get("display_name", ""),
-                "location":  item.get("location", {}).get("display_name", ""),
-                "url":       item.get("redirect_url", ""),
-                "salary":    item.get("salary_min", ""),
-                "posted":    item.get("created", ""),
-                "region":    country_code,
-                "role_query": role,
-            })
-        time.sleep(0.5)
+            job = Job(
+                source="adzuna",
+                title=item.get("title", ""),
+                company=item.get("company", {}).get("display_name", ""),
+                location=item.get("location", {}).get("display_name", ""),
+                url=item.get("redirect_url", ""),
+                salary=item.get("salary_min", ""),
+                posted=item.get("created", ""),
+                region=country_code,
+                role_query=role,
+            )
+            if is_relevant(job):
+                jobs.append(job)
     return jobs
 
 
 # ── Source 2: RemoteOK (global remote jobs) ───────────────────────────────────
-def search_remoteok(role: str) -> list[dict]:
+def search_remoteok(role: str) -> list[Job]:
     url  = f"https://remoteok.com/api?tag={urllib.parse.quote(role)}"
     data = fetch_json(url)
     if not data or not isinstance(data, list):
@@ -126,46 +242,48 @@ def search_remoteok(role: str) -> list[dict]:
     for item in data[1:]:  # first item is metadata
         if not isinstance(item, dict):
             continue
-        jobs.append({
-            "source":    "remoteok",
-            "title":     item.get("position", ""),
-            "company":   item.get("company", ""),
-            "location":  "Remote",
-            "url":       item.get("url", ""),
-            "salary":    item.get("salary", ""),
-            "posted":    item.get("date", ""),
-            "region":    "remote",
-            "role_query": role,
-        })
-    time.sleep(0.5)
+        job = Job(
+            source="remoteok",
+            title=item.get("position", ""),
+            company=item.get("company", ""),
+            location="Remote",
+            url=item.get("url", ""),
+            salary=item.get("salary", ""),
+            posted=item.get("date", ""),
+            region="remote",
+            role_query=role,
+        )
+        if is_relevant(job):
+            jobs.append(job)
     return jobs
 
 
 # ── Source 3: Remotive (tech-focused remote) ──────────────────────────────────
-def search_remotive(role: str) -> list[dict]:
+def search_remotive(role: str) -> list[Job]:
     url  = f"https://remotive.com/api/remote-jobs?search={urllib.parse.quote(role)}&limit=50"
     data = fetch_json(url)
     if not data or "jobs" not in data:
         return []
     jobs = []
     for item in data["jobs"]:
-        jobs.append({
-            "source":    "remotive",
-            "title":     item.get("title", ""),
-            "company":   item.get("company_name", ""),
-            "location":  item.get("candidate_required_location", "Remote"),
-            "url":       item.get("url", ""),
-            "salary":    item.get("salary", ""),
-            "posted":    item.get("publication_date", ""),
-            "region":    "remote",
-            "role_query": role,
-        })
-    time.sleep(0.5)
+        job = Job(
+            source="remotive",
+            title=item.get("title", ""),
+            company=item.get("company_name", ""),
+            location=item.get("candidate_required_location", "Remote"),
+            url=item.get("url", ""),
+            salary=item.get("salary", ""),
+            posted=item.get("publication_date", ""),
+            region="remote",
+            role_query=role,
+        )
+        if is_relevant(job):
+            jobs.append(job)
     return jobs
 
 
 # ── Source 4: Reed.co.uk (UK jobs, public RSS) ────────────────────────────────
-def search_reed(role: str) -> list[dict]:
+def search_reed(role: str) -> list[Job]:
     """Reed has a public API that requires a (free) API key.
     Without a key, we scrape their search page via their public JSON endpoint.
     Register free at https://www.reed.co.uk/developers/jobseeker to get a key.
@@ -184,29 +302,32 @@ def search_reed(role: str) -> list[dict]:
     })
     try:
         with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode())
+            raw = resp.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         print(f"  [Reed ERR] {e}")
         return []
 
     jobs = []
     for item in data.get("results", []):
-        jobs.append({
-            "source":    "reed",
-            "title":     item.get("jobTitle", ""),
-            "company":   item.get("employerName", ""),
-            "location":  item.get("locationName", ""),
-            "url":       item.get("jobUrl", ""),
-            "salary":    f"{item.get('minimumSalary','')}-{item.get('maximumSalary','')}",
-            "posted":    item.get("date", ""),
-            "region":    "uk",
-            "role_query": role,
-        })
+        job = Job(
+            source="reed",
+            title=item.get("jobTitle", ""),
+            company=item.get("employerName", ""),
+            location=item.get("locationName", ""),
+            url=item.get("jobUrl", ""),
+            salary=f"{item.get('minimumSalary','')}-{item.get('maximumSalary','')}",
+            posted=item.get("date", ""),
+            region="uk",
+            role_query=role,
+        )
+        if is_relevant(job):
+            jobs.append(job)
     return jobs
 
 
 # ── Source 5: The Muse (UAE / Dubai roles, free API) ─────────────────────────
-def search_themuse_uae(role: str) -> list[dict]:
+def search_themuse_uae(role: str) -> list[Job]:
     url = (
         f"https://www.themuse.com/api/public/jobs?"
         f"category=Software+Engineer&location=Dubai%2C+United+Arab+Emirates"
@@ -222,18 +343,19 @@ def search_themuse_uae(role: str) -> list[dict]:
             continue
         company = item.get("company", {}).get("name", "")
         locations = [loc.get("name", "") for loc in item.get("locations", [])]
-        jobs.append({
-            "source":    "themuse",
-            "title":     title,
-            "company":   company,
-            "location":  ", ".join(locations) or "UAE",
-            "url":       item.get("refs", {}).get("landing_page", ""),
-            "salary":    "",
-            "posted":    item.get("publication_date", ""),
-            "region":    "uae",
-            "role_query": role,
-        })
-    time.sleep(0.5)
+        job = Job(
+            source="themuse",
+            title=title,
+            company=company,
+            location=", ".join(locations) or "UAE",
+            url=item.get("refs", {}).get("landing_page", ""),
+            salary="",
+            posted=item.get("publication_date", ""),
+            region="uae",
+            role_query=role,
+        )
+        if is_relevant(job):
+            jobs.append(job)
     return jobs
 
 
@@ -250,105 +372,215 @@ EXCLUDE_KEYWORDS = [
     "8+ years", "7+ years", "architect"
 ]
 
-def score_job(job: dict) -> int:
-    text = (job["title"] + " " + job.get("company", "")).lower()
-    score = 0
-    for kw in MUST_HAVE_KEYWORDS:
-        if kw in text:
-            score += 2
-    for kw in EXCLUDE_KEYWORDS:
-        if kw in text:
-            score -= 10
+# Compiled alternations (longest keyword first, so phrases win over their
+# prefixes) score a title in three C-level regex passes instead of ~30
+# Python-level substring scans.
+_MUST_RE  = re.compile("|".join(map(re.escape, sorted(MUST_HAVE_KEYWORDS, key=len, reverse=True))))
+_EXCL_RE  = re.compile("|".join(map(re.escape, sorted(EXCLUDE_KEYWORDS, key=len, reverse=True))))
+_BOOST_RE = re.compile("junior|graduate|associate|entry")
+
+# With pyahocorasick installed, every keyword matches in one linear C-level
+# pass over the text; the token-set path below is the stdlib fallback.
+try:
+    import ahocorasick
+    _SCORE_AUTOMATON = ahocorasick.Automaton()
+    for _kw in MUST_HAVE_KEYWORDS:
+        _SCORE_AUTOMATON.add_word(_kw, (2, _kw))
+    for _kw in EXCLUDE_KEYWORDS:
+        _SCORE_AUTOMATON.add_word(_kw, (-10, _kw))
+    _SCORE_AUTOMATON.make_automaton()
+except ImportError:
+    _SCORE_AUTOMATON = None
+
+
+# The same title/company pair is scored several times per run (relevance
+# filter, sort, tracker write) — cache by the normalized text.
+@functools.lru_cache(maxsize=4096)
+def _score_text(text: str) -> int:
+    # Each keyword counts once however often it appears — presence, not
+    # occurrences — matching the original per-keyword substring checks
+    if _SCORE_AUTOMATON is not None:
+        score = sum(w for w, _ in {v for _, v in _SCORE_AUTOMATON.iter(text)})
+    else:
+        score = 2 * len(set(_MUST_RE.findall(text))) - 10 * len(set(_EXCL_RE.findall(text)))
     # Boost junior/graduate
-    if any(w in text for w in ["junior", "graduate", "associate", "entry"]):
+    if _BOOST_RE.search(text):
         score += 5
     return score
 
 
-def is_relevant(job: dict) -> bool:
-    return score_job(job) > -5
+def score_job(job: Job) -> int:
+    return _score_text((job.title + " " + job.company).lower())
+
+
+def is_relevant(job: Job) -> bool:
+    # Score once and keep it on the job — sorting and the tracker write reuse it
+    job._score = score_job(job)
+    return job._score > -5
 
 
 # ── Dedup ─────────────────────────────────────────────────────────────────────
-def dedup(jobs: list[dict]) -> list[dict]:
-    seen = set()
-    out  = []
+def _dedup_key(title: str, company: str) -> tuple:
+    """Normalized (title, company) key used for tracker dedup.
+
+    Collapses ALL whitespace — tabs and newlines included — so a key always
+    survives the tab-separated sidecar roundtrip byte-identical.
+    """
+    return (" ".join(title.lower().split()), " ".join(company.lower().split()))
+
+
+def add_jobs(all_jobs: dict, jobs: list[Job]) -> int:
+    """Merge jobs into the run's dict, deduplicating at insertion time.
+
+    The (title, company) key is computed once here and stashed on the job
+    as _key so save_tracker doesn't re-normalize the same strings.
+    """
+    added = 0
     for j in jobs:
-        key = (j["title"].lower().strip(), j["company"].lower().strip())
-        if key not in seen:
-            seen.add(key)
-            out.append(j)
-    return out
+        key = _dedup_key(j.title, j.company)
+        if key not in all_jobs:
+            j._key = key
+            all_jobs[key] = j
+            added += 1
+    return added
 
 
 # ── Load existing tracker ─────────────────────────────────────────────────────
 TRACKER_FIELDS = ["id", "date_found", "title", "company", "location", "region",
                   "source", "url", "salary", "score", "status", "cover_letter_file", "notes"]
 
-def load_tracker() -> dict[str, dict]:
+# Fixed column positions — rows travel as plain tuples instead of a
+# 13-key dict per row.
+IDX = {name: i for i, name in enumerate(TRACKER_FIELDS)}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tracker_at(mtime: float) -> dict[tuple, tuple]:
+    """Parse tracker.csv once per file version — the mtime is the cache key."""
     existing = {}
-    if TRACKER_PATH.exists():
-        with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            # If the CSV has incompatible headers (e.g. from a previous session), start fresh
-            if not reader.fieldnames or "title" not in reader.fieldnames:
-                print(f"  [tracker] Incompatible CSV format — starting fresh")
-                return {}
-            for row in reader:
-                key = (row["title"].lower().strip(), row["company"].lower().strip())
-                existing[key] = row
+    with open(TRACKER_PATH, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        # If the CSV has incompatible headers (e.g. from a previous session), start fresh
+        if not header or "title" not in header:
+            print(f"  [tracker] Incompatible CSV format — starting fresh")
+            return {}
+        i_title, i_company = header.index("title"), header.index("company")
+        for row in reader:
+            if len(row) <= max(i_title, i_company):
+                continue
+            key = _dedup_key(row[i_title], row[i_company])
+            existing[key] = tuple(row)
     return existing
 
 
-def save_tracker(jobs: list[dict], existing: dict):
-    # Merge new jobs with existing
-    all_rows = list(existing.values())
-    existing_keys = set(existing.keys())
+def load_tracker() -> dict[tuple, tuple]:
+    try:
+        mtime = TRACKER_PATH.stat().st_mtime
+    except OSError:
+        return {}
+    return _load_tracker_at(mtime)
+
 
-    new_count = 0
+def load_tracker_keys() -> set[tuple]:
+    """Dedup keys for the whole tracker, without parsing the CSV.
+
+    save_tracker only ever asks "is this (title, company) already there?",
+    so a flat sidecar of keys answers that far cheaper than walking every
+    13-column row. If the sidecar is missing or older than the CSV (edited
+    by hand, first run after this change), it's rebuilt from the full parse
+    so the two files can never drift apart.
+    """
+    try:
+        csv_mtime = TRACKER_PATH.stat().st_mtime
+    except OSError:
+        return set()
+    try:
+        if TRACKER_KEYS_PATH.stat().st_mtime >= csv_mtime:
+            with open(TRACKER_KEYS_PATH, encoding="utf-8") as f:
+                return {tuple(line.rstrip("\n").split("\t", 1)) for line in f if "\t" in line}
+    except OSError:
+        pass
+    keys = set(load_tracker().keys())
+    with open(TRACKER_KEYS_PATH, "w", encoding="utf-8") as f:
+        f.writelines(f"{t}\t{c}\n" for t, c in keys)
+    return keys
+
+
+def save_tracker(jobs: list[Job], existing_keys: set):
+    # Only the delta is appended — existing rows never leave the file, so
+    # write cost is O(new jobs) rather than O(tracker lifetime)
+    existing_keys = set(existing_keys)
+    next_id = len(existing_keys) + 1
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    new_rows = []
+    new_keys = []
     for j in jobs:
-        key = (j["title"].lower().strip(), j["company"].lower().strip())
-        if key not in existing_keys:
-            row_id = len(all_rows) + 1
-            all_rows.append({
-                "id":                str(row_id),
-                "date_found":        datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-                "title":             j["title"],
-                "company":           j["company"],
-                "location":          j["location"],
-                "region":            j["region"],
-                "source":            j["source"],
-                "url":               j["url"],
-                "salary":            str(j.get("salary", "")),
-                "score":             str(score_job(j)),
-                "status":            "found",
-                "cover_letter_file": "",
-                "notes":             "",
-            })
-            existing_keys.add(key)
-            new_count += 1
-
-    with open(TRACKER_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS)
-        writer.writeheader()
-        writer.writerows(all_rows)
-
-    return new_count
+        key = j._key or _dedup_key(j.title, j.company)
+        if key in existing_keys:
+            continue
+        new_rows.append((
+            str(next_id),
+            today,
+            j.title,
+            j.company,
+            j.location,
+            j.region,
+            j.source,
+            j.url,
+            str(j.salary),
+            str(j._score),
+            "found",                                         # status
+            "",                                              # cover_letter_file
+            "",                                              # notes
+        ))
+        existing_keys.add(key)
+        new_keys.append(key)
+        next_id += 1
+
+    new_file = not TRACKER_PATH.exists()
+    rewrite = False
+    if not new_file:
+        # Mirror the loader's "starting fresh" path: if the header is
+        # incompatible the old rows were ignored, so appending under it would
+        # leave a mixed-schema file — replace it with a clean one instead.
+        with open(TRACKER_PATH, encoding="utf-8") as f:
+            rewrite = "title" not in f.readline()
+    if new_rows or new_file or rewrite:
+        fresh = new_file or rewrite
+        with open(TRACKER_PATH, "w" if fresh else "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if fresh:
+                writer.writerow(TRACKER_FIELDS)
+            writer.writerows(new_rows)
+            f.flush()
+            os.fsync(f.fileno())  # cron box can restart mid-run — make it stick
+        # Keep the sidecar in step (CSV first, so a crash between the two
+        # writes just triggers a rebuild on the next run)
+        with open(TRACKER_KEYS_PATH, "w" if fresh else "a", encoding="utf-8") as f:
+            f.writelines(f"{t}\t{c}\n" for t, c in new_keys)
+
+    return len(new_rows)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="Job search automation for Krish Sawhney")
-    parser.add_argument("--region",  default="all",  help="uk | uae | india | germany | netherlands | remote | all")
-    parser.add_argument("--role",    default="all",  help="Specific role to search, or 'all'")
-    parser.add_argument("--max",     type=int, default=3, help="Max Adzuna pages per query (20 results/page)")
-    args = parser.parse_args()
+    if len(sys.argv) == 1:
+        # Cron runs with no flags — skip building the parser entirely
+        args = argparse.Namespace(region="all", role="all", max=3)
+    else:
+        parser = argparse.ArgumentParser(description="Job search automation for Krish Sawhney")
+        parser.add_argument("--region",  default="all",  help="uk | uae | india | germany | netherlands | remote | all")
+        parser.add_argument("--role",    default="all",  help="Specific role to search, or 'all'")
+        parser.add_argument("--max",     type=int, default=3, help="Max Adzuna pages per query (20 results/page)")
+        args = parser.parse_args()
 
     roles = SEARCH_TERMS if args.role == "all" else [args.role]
     regions = list(ADZUNA_REGIONS.keys()) if args.region == "all" else [args.region.lower()]
 
-    all_jobs: list[dict] = []
+    # Keyed by (title, company) — duplicates are dropped as results arrive
+    all_jobs: dict[tuple, Job] = {}
 
     print(f"\n{'='*60}")
     print(f"  Job Search — {datetime.now().strftime('%Y-%m-%d %H:%M')}")
@@ -356,6 +588,12 @@ def main():
     print(f"  Roles   : {len(roles)} search terms")
     print(f"{'='*60}\n")
 
+    _prune_http_cache()
+
+    # One fetch task per (source, role). The calls are network-bound, so they
+    # run on a thread pool and overlap instead of paying each RTT serially.
+    tasks = []  # (source label, role, zero-arg callable)
+
     # ── Adzuna ──
     for region in regions:
         if region == "remote":
@@ -364,73 +602,72 @@ def main():
         if not adzuna_country:
             print(f"[SKIP] Unknown region: {region}")
             continue
-        print(f"[Adzuna] Searching {region.upper()}...")
         for role in roles[:5]:  # limit to top 5 terms to avoid rate limits
-            jobs = search_adzuna(role, adzuna_country, args.max)
-            relevant = [j for j in jobs if is_relevant(j)]
-            all_jobs.extend(relevant)
-            print(f"  '{role}' → {len(jobs)} found, {len(relevant)} relevant")
+            tasks.append((f"Adzuna/{region.upper()}", role,
+                          functools.partial(search_adzuna, role, adzuna_country, args.max)))
 
     # ── UAE via The Muse (Adzuna doesn't cover ae) ──
     if args.region in ("all", "uae"):
-        print("\n[TheMuse] Searching UAE roles...")
         for role in ["junior software engineer", "fullstack developer", "developer"]:
-            jobs = search_themuse_uae(role)
-            relevant = [j for j in jobs if is_relevant(j)]
-            all_jobs.extend(relevant)
-            print(f"  '{role}' → {len(jobs)} found, {len(relevant)} relevant")
+            tasks.append(("TheMuse/UAE", role, functools.partial(search_themuse_uae, role)))
 
     # ── RemoteOK ──
     if args.region in ("all", "remote"):
-        print("\n[RemoteOK] Searching remote roles...")
         for role in ["junior ai engineer", "junior fullstack developer", "junior python developer"]:
-            jobs = search_remoteok(role)
-            relevant = [j for j in jobs if is_relevant(j)]
-            all_jobs.extend(relevant)
-            print(f"  '{role}' → {len(jobs)} found, {len(relevant)} relevant")
+            tasks.append(("RemoteOK", role, functools.partial(search_remoteok, role)))
 
     # ── Remotive ──
     if args.region in ("all", "remote"):
-        print("\n[Remotive] Searching remote roles...")
         for role in ["junior software engineer", "fullstack developer", "ml engineer"]:
-            jobs = search_remotive(role)
-            relevant = [j for j in jobs if is_relevant(j)]
-            all_jobs.extend(relevant)
-            print(f"  '{role}' → {len(jobs)} found, {len(relevant)} relevant")
+            tasks.append(("Remotive", role, functools.partial(search_remotive, role)))
 
     # ── Reed (UK, if key set) ──
     if os.environ.get("REED_API_KEY") and args.region in ("all", "uk"):
-        print("\n[Reed] Searching UK roles...")
         for role in ["junior ai developer", "junior fullstack developer"]:
-            jobs = search_reed(role)
-            relevant = [j for j in jobs if is_relevant(j)]
-            all_jobs.extend(relevant)
-            print(f"  '{role}' → {len(jobs)} found, {len(relevant)} relevant")
-
-    # ── Dedup + save ──
-    all_jobs = dedup(all_jobs)
-    all_jobs.sort(key=lambda j: score_job(j), reverse=True)
-
-    existing = load_tracker()
-    new_count = save_tracker(all_jobs, existing)
+            tasks.append(("Reed", role, functools.partial(search_reed, role)))
+
+    print(f"[Searching] {len(tasks)} queries across all sources...")
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        futures = [(label, role, pool.submit(fn)) for label, role, fn in tasks]
+        for label, role, fut in futures:
+            try:
+                jobs = fut.result()
+            except Exception as e:
+                print(f"  [{label}] '{role}' → failed: {e}")
+                continue
+            add_jobs(all_jobs, jobs)
+            print(f"  [{label}] '{role}' → {len(jobs)} relevant")
+
+    # ── Rank + save (already deduplicated on insert) ──
+    ranked = sorted(all_jobs.values(), key=attrgetter("_score"), reverse=True)
+
+    existing_keys = load_tracker_keys()
+    new_count = save_tracker(ranked, existing_keys)
 
     # ── Print summary ──
     print(f"\n{'='*60}")
-    print(f"  Total unique jobs found : {len(all_jobs)}")
+    print(f"  Total unique jobs found : {len(ranked)}")
     print(f"  New jobs added          : {new_count}")
     print(f"  Tracker saved to        : {TRACKER_PATH}")
     print(f"{'='*60}")
 
     # Save a fresh leads file (top 30, sorted by score)
     leads_file = LEADS_DIR / f"leads_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
-    with open(leads_file, "w") as f:
-        json.dump(all_jobs[:30], f, indent=2)
+    leads = [j._asdict() for j in ranked[:30]]
+    if orjson is not None:
+        payload = orjson.dumps(leads, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(leads, indent=2).encode("utf-8")
+    # Binary mode: the bytes go straight out instead of through the text-layer
+    # encode + buffer
+    with open(leads_file, "wb") as f:
+        f.write(payload)
     print(f"  Leads snapshot saved    : {leads_file}")
 
     # Print top 15
     print("\n── Top 15 Leads ─────────────────────────────────────────")
-    for i, j in enumerate(all_jobs[:15], 1):
-        print(f"  {i:>2}. [{j['region'].upper():^5}] {j['title'][:45]:<45} | {j['company'][:25]:<25} | {j['url'][:60]}")
+    for i, j in enumerate(ranked[:15], 1):
+        print(f"  {i:>2}. [{j.region.upper():^5}] {j.title[:45]:<45} | {j.company[:25]:<25} | {j.url[:60]}")
 
     print(f"\nNext step: run apply.py to generate cover letters and draft applications.\n")
 